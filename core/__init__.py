@@ -3,39 +3,70 @@ Core initialization module for TerraScope.
 Handles package initialization and configuration.
 """
 import os
-import sys
+import time
 import logging
+import subprocess
+import threading
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("output/terraform.log", mode='a'),
-        logging.StreamHandler()
-    ]
-)
-
+# Logging is configured by initialize_app, so importing core has no side effects
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-def initialize_app():
-    """Initialize the application and verify dependencies."""
-    logger.info("Initializing TerraScope application...")
+# Last detected Terraform version, trusted for a day so startup skips the probe
+TF_VERSION_CACHE = os.path.join("output", ".tf_version")
+TF_VERSION_TTL = 24 * 60 * 60
+
+def configure_logging():
+    """Log to output/terraform.log and the console."""
+    os.makedirs("output", exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler("output/terraform.log", mode='a'),
+            logging.StreamHandler()
+        ]
+    )
+
+def read_cached_terraform_version():
+    """
+    Read the Terraform version detected by a recent check.
     
-    # Check for Terraform installation
+    Returns:
+        Version line, or None if the cache is missing or older than the TTL
+    """
+    try:
+        if time.time() - os.path.getmtime(TF_VERSION_CACHE) < TF_VERSION_TTL:
+            with open(TF_VERSION_CACHE, 'r') as f:
+                return f.read().strip() or None
+    except OSError:
+        pass
+    return None
+
+def check_terraform():
+    """Check for a Terraform installation and cache the detected version."""
     try:
-        import subprocess
         result = subprocess.run(['terraform', '--version'], capture_output=True, text=True)
         if result.returncode == 0:
-            logger.info(f"Terraform detected: {result.stdout.splitlines()[0]}")
+            version = result.stdout.splitlines()[0]
+            logger.info(f"Terraform detected: {version}")
+            with open(TF_VERSION_CACHE, 'w') as f:
+                f.write(version)
         else:
             logger.warning("Terraform not found in PATH. Some features may not work.")
     except Exception as e:
         logger.warning(f"Error checking Terraform: {e}")
+
+def initialize_app():
+    """Initialize the application and verify dependencies."""
+    configure_logging()
+    logger.info("Initializing TerraScope application...")
     
-    # Add project root to path
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    if project_root not in sys.path:
-        sys.path.append(project_root)
+    # Check for Terraform installation without blocking startup on the probe
+    version = read_cached_terraform_version()
+    if version:
+        logger.info(f"Terraform detected: {version}")
+    else:
+        threading.Thread(target=check_terraform, name="terraform-check", daemon=True).start()
     
     logger.info("Initialization complete")
\ No newline at end of file
@@ -3,35 +3,166 @@
 ResourceManager handles loading, validation, and management of
 infrastructure resources from templates.
 """
+import hashlib
 import json
+import logging
 import os
-from typing import Dict, List, Any, Optional
+import pickle
+import sys
+from typing import Dict, List, Any, Optional, Tuple
+
+try:
+    import orjson # Optional, parses large catalogs several times faster
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Overrides where the parsed-resources cache is kept
+_CACHE_DIR_ENV = "TERRASCOPE_CACHE_DIR"
+
+def _default_cache_dir() -> str:
+    """
+    Get the per-user cache directory for TerraScope.
+    
+    Returns:
+        TERRASCOPE_CACHE_DIR if set, otherwise the platform's user cache directory
+    """
+    if os.environ.get(_CACHE_DIR_ENV):
+        return os.environ[_CACHE_DIR_ENV]
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "terrascope")
 
 class ResourceManager:
     """creating a new class that Manages infrastructure resources and their templates."""
     
     # kinda like the constructors in the original code, but this is a class that manages resources.
-    def __init__(self, resources_path: str = "data/resources.json"):
+    def __init__(self, resources_path: str = "data/resources.json",
+                 resources: Optional[Dict[str, Dict]] = None,
+                 cache_dir: Optional[str] = None, use_cache: bool = True):
         """
         Initialize the ResourceManager.
         
         Args:
             resources_path: Path to the JSON file containing resource templates
+            resources: Already loaded resource templates; skips reading the file
+            cache_dir: Directory for the parsed-resources cache (defaults to
+                the user's cache directory)
+            use_cache: Whether to read and write the parsed-resources cache
         """
         
         self.resources_path = resources_path # Path to the JSON file
+        self.cache_dir = cache_dir or _default_cache_dir()
+        self.use_cache = use_cache
         self.resources: Dict[str, Dict] = {} # Dictionary to hold resource templates
-        self.load_resources() # Load resources from the JSON file
+        self._by_provider: Dict[str, Dict[str, Dict]] = {} # Lowercased provider -> resources
+        self._groups: List[str] = [] # Provider names as they appear in the templates
+        self._grouped: Dict[str, List[str]] = {} # Lowercased provider -> resource types
+        self._popular: List[str] = [] # Popular resource types, highest score first
+        if resources is not None:
+            self.resources = resources
+            self._build_indexes()
+        else:
+            self.load_resources() # Load resources from the JSON file
     
     def load_resources(self) -> None:
         """Load resources from the JSON template file."""
         try:
-            with open(self.resources_path, 'r') as f:
-                self.resources = json.load(f) # Load JSON data
-                print(f"Loaded {len(self.resources)} resource types") # counts how many resources were loaded
+            # The cache is only valid for the exact file it was built from
+            stat = os.stat(self.resources_path)
+            source_key = (stat.st_mtime_ns, stat.st_size)
+            
+            resources = None
+            if self.use_cache:
+                resources = self._read_cache(source_key) # Skip JSON parsing on warm starts
+            if resources is None:
+                resources = self._parse_resources_file() # Load JSON data
+                if self.use_cache:
+                    self._write_cache(source_key, resources)
+            
+            self.resources = resources
+            print(f"Loaded {len(self.resources)} resource types") # counts how many resources were loaded
         except Exception as e:
             print(f"Error loading resources: {e}")
             self.resources = {}
+        
+        self._build_indexes()
+    
+    def _build_indexes(self) -> None:
+        """Index resources by provider and popularity so lookups don't rescan."""
+        self._by_provider = {}
+        groups = {}
+        for resource_type, resource in self.resources.items():
+            provider = resource.get("provider", "")
+            self._by_provider.setdefault(provider.lower(), {})[resource_type] = resource
+            if "provider" in resource:
+                groups[provider] = None # dict keeps first-seen order, unlike a set
+        self._groups = list(groups)
+        self._grouped = {provider: list(resources) for provider, resources in self._by_provider.items()}
+        
+        # Optional popularity_score ranks popular resources; the sort is
+        # stable, so unscored ones keep their file order
+        popular = [k for k, v in self.resources.items() if v.get("popular", False)]
+        self._popular = sorted(popular, key=lambda k: self.resources[k].get("popularity_score", 0),
+                               reverse=True)
+    
+    def _parse_resources_file(self) -> Dict[str, Dict]:
+        """
+        Parse the JSON template file, with orjson when it is installed.
+        
+        Returns:
+            Parsed resources dictionary
+        """
+        if orjson is not None:
+            with open(self.resources_path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(self.resources_path, 'r') as f:
+            return json.load(f)
+    
+    @property
+    def cache_path(self) -> str:
+        """Path of the pickle cache for this resources file, in the cache directory."""
+        # Named after the absolute source path so each resources file gets its own cache
+        digest = hashlib.sha1(os.path.abspath(self.resources_path).encode()).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"resources-{digest}.pkl")
+    
+    def _read_cache(self, source_key: Tuple[int, int]) -> Optional[Dict[str, Dict]]:
+        """
+        Read parsed resources from the pickle cache.
+        
+        Args:
+            source_key: (mtime_ns, size) of the resources file
+            
+        Returns:
+            Cached resources, or None if the cache is missing or stale
+        """
+        try:
+            with open(self.cache_path, 'rb') as f:
+                cached_key, resources = pickle.load(f)
+        except Exception:
+            return None
+        return resources if cached_key == source_key else None
+    
+    def _write_cache(self, source_key: Tuple[int, int], resources: Dict[str, Dict]) -> None:
+        """
+        Write parsed resources to the pickle cache.
+        
+        Args:
+            source_key: (mtime_ns, size) of the resources file
+            resources: Parsed resources to cache
+        """
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self.cache_path, 'wb') as f:
+                pickle.dump((source_key, resources), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            # A missing cache only costs a JSON parse on the next start
+            logger.warning(f"Could not write resource cache: {e}")
     
     def get_resource_template(self, resource_type: str) -> Optional[Dict]:
         """
@@ -52,11 +183,7 @@ class ResourceManager:
         Returns:
             List of resource group names
         """
-        groups = set() 
-        for resource in self.resources.values(): # Iterate through all resources
-            if "provider" in resource: # Check if the resource has a provider
-                groups.add(resource["provider"]) # Add the provider to the set
-        return list(groups) 
+        return self._groups
     
     def get_resources_by_provider(self, provider: str) -> Dict[str, Dict]:
         """
@@ -68,21 +195,31 @@ class ResourceManager:
         Returns:
             Dictionary of resources for the specified provider
         """
-        return {
-            k: v for k, v in self.resources.items()  
-            if v.get("provider", "").lower() == provider.lower()
-            # Filter resources by provider
-        }
+        return self._by_provider.get(provider.lower(), {})
+    
+    def get_all_resources_grouped(self) -> Dict[str, List[str]]:
+        """
+        Get every resource type grouped by provider.
+        
+        Built once per load, so callers listing all providers share one
+        precomputed mapping instead of filtering per provider.
+        
+        Returns:
+            Dictionary of lowercase provider name to resource type names
+        """
+        return self._grouped
     
     def get_popular_resources(self, limit: int = 10) -> List[str]:
         """
         Get the most popular resources based on metadata.
         
+        Resources marked popular are ordered by their optional
+        popularity_score, highest first.
+        
         Args:
             limit: Maximum number of resources to return
             
         Returns:
             List of popular resource type names
         """
-        popular = [k for k, v in self.resources.items() if v.get("popular", False)]
-        return popular[:limit]
\ No newline at end of file
+        return self._popular[:limit]
\ No newline at end of file
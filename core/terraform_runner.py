@@ -12,20 +12,57 @@ logger = logging.getLogger(__name__)
 class TerraformRunner:
     """Handles execution of Terraform CLI commands."""
     
-    def __init__(self, working_dir: str = "output"):
+    # Saved plan written by plan and consumed by apply so apply doesn't re-plan
+    PLAN_FILE = "tfplan"
+    
+    def __init__(self, working_dir: str = "output", parallelism: Optional[int] = None,
+                 refresh: bool = True, timeout: Optional[float] = 3600):
         """
         Initialize the TerraformRunner.
         
         Args:
             working_dir: Directory where Terraform commands will be executed
+            parallelism: Number of concurrent operations Terraform walks the
+                graph with (defaults to 3x the logical CPU count)
+            refresh: Whether plan/apply/destroy refresh state before running
+            timeout: Seconds before a hung command is killed (None waits forever)
         """
         self.working_dir = working_dir
+        self.parallelism = parallelism or (os.cpu_count() or 1) * 3
+        self.refresh = refresh
+        self.timeout = timeout
+        self.env = self._build_env()
         self._ensure_dir_exists()
     
+    @staticmethod
+    def _build_env() -> Dict[str, str]:
+        """
+        Build the environment terraform runs with, once per runner.
+        
+        Terraform inherits the whole environment: providers, module sources
+        and credential helpers each read their own variables.
+        
+        Returns:
+            Copy of the current environment
+        """
+        return dict(os.environ)
+    
     def _ensure_dir_exists(self) -> None:
         """Ensure the working directory exists."""
         os.makedirs(self.working_dir, exist_ok=True)
     
+    def _graph_walk_options(self) -> List[str]:
+        """
+        Build the options shared by plan, apply and destroy.
+        
+        Returns:
+            List of command options
+        """
+        options = [f"-parallelism={self.parallelism}"]
+        if not self.refresh:
+            options.append("-refresh=false")
+        return options
+    
     def run_command(self, command: List[str]) -> Tuple[int, str, str]:
         """
         Run a Terraform command.
@@ -38,28 +75,103 @@ class TerraformRunner:
         """
         full_command = ["terraform"] + command
         logger.info(f"Running: {' '.join(full_command)}")
+        return self._execute(full_command)
+    
+    def _execute(self, full_command: List[str]) -> Tuple[int, str, str]:
+        """
+        Execute a command in the working directory and capture its output.
         
+        Args:
+            full_command: Argument list, executed without a shell so a timeout
+                kills terraform itself
+            
+        Returns:
+            Tuple of (return_code, stdout, stderr)
+        """
         try:
-            process = subprocess.Popen(
+            result = subprocess.run(
                 full_command,
                 cwd=self.working_dir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                env=self.env,
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+                check=False
             )
-            stdout, stderr = process.communicate()
-            return_code = process.returncode
             
-            if return_code == 0:
+            if result.returncode == 0:
                 logger.info(f"Command completed successfully")
             else:
-                logger.error(f"Command failed with code {return_code}")
+                logger.error(f"Command failed with code {result.returncode}")
                 
-            return return_code, stdout, stderr
+            return result.returncode, result.stdout, result.stderr
+        except subprocess.TimeoutExpired:
+            logger.error(f"Command timed out after {self.timeout} seconds")
+            return 1, "", f"Terraform command timed out after {self.timeout} seconds"
         except Exception as e:
             logger.error(f"Error running Terraform command: {e}")
             return 1, "", str(e)
     
+    def init_args(self) -> List[str]:
+        """
+        Build the arguments for terraform init.
+        
+        Returns:
+            List of command parts
+        """
+        return ["init", "-no-color"]
+    
+    def plan_args(self, out_file: Optional[str] = None) -> List[str]:
+        """
+        Build the arguments for terraform plan.
+        
+        Args:
+            out_file: Optional file to save the plan to for a later apply
+            
+        Returns:
+            List of command parts
+        """
+        command = ["plan", "-no-color"] + self._graph_walk_options()
+        if out_file:
+            command.append(f"-out={out_file}")
+        return command
+    
+    def apply_args(self, auto_approve: bool = False, plan_file: Optional[str] = None) -> List[str]:
+        """
+        Build the arguments for terraform apply.
+        
+        Args:
+            auto_approve: Whether to automatically approve the apply
+            plan_file: Optional saved plan to apply instead of planning again
+            
+        Returns:
+            List of command parts
+        """
+        if plan_file:
+            # A saved plan already carries its refresh setting and is applied
+            # without prompting, so only parallelism can still be passed
+            return ["apply", "-no-color", f"-parallelism={self.parallelism}", plan_file]
+        
+        command = ["apply", "-no-color"] + self._graph_walk_options()
+        if auto_approve:
+            command.append("-auto-approve")
+        return command
+    
+    def destroy_args(self, auto_approve: bool = False) -> List[str]:
+        """
+        Build the arguments for terraform destroy.
+        
+        Args:
+            auto_approve: Whether to automatically approve the destroy
+            
+        Returns:
+            List of command parts
+        """
+        command = ["destroy", "-no-color"] + self._graph_walk_options()
+        if auto_approve:
+            command.append("-auto-approve")
+        return command
+    
     def init(self) -> Tuple[bool, str]:
         """
         Run terraform init.
@@ -67,7 +179,7 @@ class TerraformRunner:
         Returns:
             Tuple of (success, message)
         """
-        code, stdout, stderr = self.run_command(["init", "-no-color"])
+        code, stdout, stderr = self.run_command(self.init_args())
         return code == 0, stdout if code == 0 else stderr
     
     def plan(self) -> Tuple[bool, str]:
@@ -77,7 +189,7 @@ class TerraformRunner:
         Returns:
             Tuple of (success, message)
         """
-        code, stdout, stderr = self.run_command(["plan", "-no-color"])
+        code, stdout, stderr = self.run_command(self.plan_args())
         return code == 0, stdout if code == 0 else stderr
     
     def apply(self, auto_approve: bool = False) -> Tuple[bool, str]:
@@ -90,11 +202,7 @@ class TerraformRunner:
         Returns:
             Tuple of (success, message)
         """
-        command = ["apply", "-no-color"]
-        if auto_approve:
-            command.append("-auto-approve")
-            
-        code, stdout, stderr = self.run_command(command)
+        code, stdout, stderr = self.run_command(self.apply_args(auto_approve))
         return code == 0, stdout if code == 0 else stderr
     
     def destroy(self, auto_approve: bool = False) -> Tuple[bool, str]:
@@ -107,9 +215,5 @@ class TerraformRunner:
         Returns:
             Tuple of (success, message)
         """
-        command = ["destroy", "-no-color"]
-        if auto_approve:
-            command.append("-auto-approve")
-            
-        code, stdout, stderr = self.run_command(command)
+        code, stdout, stderr = self.run_command(self.destroy_args(auto_approve))
         return code == 0, stdout if code == 0 else stderr
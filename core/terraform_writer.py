@@ -5,7 +5,24 @@ resource templates and user configurations.
 """
 import os
 import json
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple
+
+# Characters that are not valid in HCL identifiers, mapped in a single pass
+_NAME_TRANS = str.maketrans({"-": "_", " ": "_"})
+
+# HCL spelling of booleans, looked up instead of calling str(value).lower()
+_BOOL_STR = {True: "true", False: "false"}
+
+# Prefixes of string values that are HCL references and must stay unquoted
+_HCL_REF_PREFIXES = ("var.", "local.", "module.", "data.")
+
+# Number of rendered resource blocks kept before the cache is reset
+_BLOCK_CACHE_SIZE = 512
+
+# Lists the files generate_split_tf wrote, so switching layouts only ever
+# removes files this writer created
+_SPLIT_MANIFEST = ".terrascope-split"
 
 class TerraformWriter:
     """Generates Terraform HCL files from resource configurations."""
@@ -18,6 +35,7 @@ class TerraformWriter:
             output_dir: Directory where Terraform files will be written
         """
         self.output_dir = output_dir
+        self._block_cache: Dict[Tuple[str, str, str], str] = {}
         os.makedirs(output_dir, exist_ok=True)
     
     def create_terraform_block(self, backend_type: Optional[str] = None, 
@@ -32,22 +50,22 @@ class TerraformWriter:
         Returns:
             HCL string for the terraform block
         """
-        terraform_block = "terraform {\n  required_version = \">= 1.0.0\"\n"
+        parts = ["terraform {\n  required_version = \">= 1.0.0\"\n"]
         
         if backend_type and backend_config:
-            terraform_block += f"  backend \"{backend_type}\" {{\n"
+            parts.append(f"  backend \"{backend_type}\" {{\n")
             for key, value in backend_config.items():
                 # Format the value based on type
                 if isinstance(value, str):
-                    terraform_block += f'    {key} = "{value}"\n'
+                    parts.append(f'    {key} = "{value}"\n')
                 elif isinstance(value, bool):
-                    terraform_block += f"    {key} = {str(value).lower()}\n"
+                    parts.append(f"    {key} = {_BOOL_STR[value]}\n")
                 else:
-                    terraform_block += f"    {key} = {value}\n"
-            terraform_block += "  }\n"
+                    parts.append(f"    {key} = {value}\n")
+            parts.append("  }\n")
         
-        terraform_block += "}\n"
-        return terraform_block
+        parts.append("}\n")
+        return "".join(parts)
     
     def create_provider_block(self, provider: str, config: Dict) -> str:
         """
@@ -60,19 +78,19 @@ class TerraformWriter:
         Returns:
             HCL string for the provider block
         """
-        provider_block = f'provider "{provider}" {{\n'
+        parts = [f'provider "{provider}" {{\n']
         
         for key, value in config.items():
             # Format the value based on type
             if isinstance(value, str):
-                provider_block += f'  {key} = "{value}"\n'
+                parts.append(f'  {key} = "{value}"\n')
             elif isinstance(value, bool):
-                provider_block += f"  {key} = {str(value).lower()}\n"
+                parts.append(f"  {key} = {_BOOL_STR[value]}\n")
             else:
-                provider_block += f"  {key} = {value}\n"
+                parts.append(f"  {key} = {value}\n")
         
-        provider_block += "}\n"
-        return provider_block
+        parts.append("}\n")
+        return "".join(parts)
     
     def create_resource_block(self, resource_type: str, resource_name: str, 
                               config: Dict) -> str:
@@ -87,72 +105,96 @@ class TerraformWriter:
         Returns:
             HCL string for the resource block
         """
+        # Preview and save render the same resources back to back, so reuse
+        # blocks whose inputs are unchanged. repr keeps key order and value
+        # types (a tuple renders differently from a list), unlike json.dumps.
+        try:
+            cache_key = (resource_type, resource_name, repr(config))
+        except RecursionError:
+            cache_key = None # Too deep to key on, render without caching
+        cached = self._block_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         # Sanitize resource name to be valid HCL identifier
-        safe_name = resource_name.replace("-", "_").replace(" ", "_").lower()
+        safe_name = resource_name.translate(_NAME_TRANS).lower()
         
-        resource_block = f'resource "{resource_type}" "{safe_name}" {{\n'
+        parts = [f'resource "{resource_type}" "{safe_name}" {{\n']
         
-        # Process nested configurations recursively
+        # Process nested configurations
         for key, value in config.items():
-            resource_block += self._format_attribute(key, value, indent=2)
+            self._format_attribute(key, value, 2, parts)
         
-        resource_block += "}\n"
-        return resource_block
+        parts.append("}\n")
+        block = "".join(parts)
+        
+        if cache_key is not None:
+            if len(self._block_cache) >= _BLOCK_CACHE_SIZE:
+                self._block_cache.clear()
+            self._block_cache[cache_key] = block
+        return block
     
-    def _format_attribute(self, key: str, value: Any, indent: int = 0) -> str:
+    def _format_attribute(self, key: str, value: Any, indent: int, parts: List[str]) -> None:
         """
         Format a configuration attribute for HCL.
         
+        Nested values are walked with an explicit stack instead of recursion,
+        so deep configurations neither pay per-level call overhead nor hit
+        the recursion limit.
+        
         Args:
             key: Attribute name
             value: Attribute value
             indent: Indentation level
+            parts: Output buffer the formatted HCL lines are appended to
+        """
+        # Entries are either (key, value, indent) frames still to format or
+        # literal strings (closing braces, block headers) to emit as-is.
+        # Children are pushed in reverse so they pop in their original order.
+        stack: List[Any] = [(key, value, indent)]
+        
+        while stack:
+            frame = stack.pop()
+            if isinstance(frame, str):
+                parts.append(frame)
+                continue
             
-        Returns:
-            Formatted HCL string for the attribute
-        """
-        spaces = " " * indent
-        
-        if isinstance(value, dict):
-            result = f"{spaces}{key} {{\n"
-            for nested_key, nested_value in value.items():
-                result += self._format_attribute(nested_key, nested_value, indent + 2)
-            result += f"{spaces}}}\n"
-            return result
-        elif isinstance(value, list):
-            if not value:
-                return f"{spaces}{key} = []\n"
+            key, value, indent = frame
+            spaces = " " * indent
             
-            if isinstance(value[0], dict):
-                result = ""
-                for item in value:
-                    result += f"{spaces}{key} {{\n"
-                    for nested_key, nested_value in item.items():
-                        result += self._format_attribute(nested_key, nested_value, indent + 2)
-                    result += f"{spaces}}}\n"
-                return result
-            else:
-                formatted_items = []
-                for item in value:
-                    if isinstance(item, str):
-                        formatted_items.append(f'"{item}"')
-                    elif isinstance(item, bool):
-                        formatted_items.append(str(item).lower())
-                    else:
-                        formatted_items.append(str(item))
-                
-                return f"{spaces}{key} = [{', '.join(formatted_items)}]\n"
-        elif isinstance(value, str):
-            # Check if the string is a reference (starts with var., local., etc.)
-            if (value.startswith("var.") or value.startswith("local.") or 
-                value.startswith("module.") or value.startswith("data.")):
-                return f"{spaces}{key} = {value}\n"
+            if isinstance(value, dict):
+                parts.append(f"{spaces}{key} {{\n")
+                stack.append(f"{spaces}}}\n")
+                stack.extend((k, v, indent + 2) for k, v in reversed(value.items()))
+            elif isinstance(value, list):
+                if not value:
+                    parts.append(f"{spaces}{key} = []\n")
+                elif isinstance(value[0], dict):
+                    for item in reversed(value):
+                        stack.append(f"{spaces}}}\n")
+                        stack.extend((k, v, indent + 2) for k, v in reversed(item.items()))
+                        stack.append(f"{spaces}{key} {{\n")
+                else:
+                    formatted_items = []
+                    for item in value:
+                        if isinstance(item, str):
+                            formatted_items.append(f'"{item}"')
+                        elif isinstance(item, bool):
+                            formatted_items.append(_BOOL_STR[item])
+                        else:
+                            formatted_items.append(str(item))
+                    
+                    parts.append(f"{spaces}{key} = [{', '.join(formatted_items)}]\n")
+            elif isinstance(value, str):
+                # Check if the string is a reference (starts with var., local., etc.)
+                if value.startswith(_HCL_REF_PREFIXES):
+                    parts.append(f"{spaces}{key} = {value}\n")
+                else:
+                    parts.append(f'{spaces}{key} = "{value}"\n')
+            elif isinstance(value, bool):
+                parts.append(f"{spaces}{key} = {_BOOL_STR[value]}\n")
             else:
-                return f'{spaces}{key} = "{value}"\n'
-        elif isinstance(value, bool):
-            return f"{spaces}{key} = {str(value).lower()}\n"
-        else:
-            return f"{spaces}{key} = {value}\n"
+                parts.append(f"{spaces}{key} = {value}\n")
     
     def write_terraform_file(self, filename: str, content: str) -> bool:
         """
@@ -174,11 +216,101 @@ class TerraformWriter:
             print(f"Error writing file {filename}: {e}")
             return False
     
+    def _remove_terraform_file(self, filename: str) -> None:
+        """
+        Remove a previously generated Terraform file if it exists.
+        
+        Args:
+            filename: Name of the file to remove
+        """
+        try:
+            os.remove(os.path.join(self.output_dir, filename))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error removing file {filename}: {e}")
+    
+    def _read_split_manifest(self) -> List[str]:
+        """
+        Read the names of the files written by the last split.
+        
+        Returns:
+            File names from the manifest, empty if there is none
+        """
+        try:
+            with open(os.path.join(self.output_dir, _SPLIT_MANIFEST)) as f:
+                return [line for line in f.read().splitlines() if line]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"Error reading file {_SPLIT_MANIFEST}: {e}")
+            return []
+    
+    @staticmethod
+    def _provider_of(resource_type: str) -> str:
+        """
+        Get the provider a resource type belongs to.
+        
+        Terraform names resource types after their provider, so the
+        provider is the prefix before the first underscore.
+        
+        Args:
+            resource_type: Type of resource (e.g., "aws_s3_bucket")
+            
+        Returns:
+            Provider name (e.g., "aws")
+        """
+        return resource_type.split("_", 1)[0]
+    
+    def _iter_main_tf(self, resources: List[Dict], 
+                      providers: Dict[str, Dict] = None) -> Iterator[str]:
+        """
+        Yield the main.tf content block by block.
+        
+        Args:
+            resources: List of resource configurations
+            providers: Dictionary of provider configurations
+            
+        Yields:
+            HCL strings in file order
+        """
+        # Add provider blocks
+        if providers:
+            for provider_name, provider_config in providers.items():
+                yield self.create_provider_block(provider_name, provider_config)
+                yield "\n"
+        
+        # Add resource blocks
+        for resource in resources:
+            yield self.create_resource_block(
+                resource["type"], 
+                resource["name"], 
+                resource["config"]
+            )
+            yield "\n"
+    
+    def render_main_tf(self, resources: List[Dict], 
+                       providers: Dict[str, Dict] = None) -> str:
+        """
+        Render the main.tf content with resources and providers.
+        
+        Args:
+            resources: List of resource configurations
+            providers: Dictionary of provider configurations
+            
+        Returns:
+            HCL string for the whole file
+        """
+        return "".join(self._iter_main_tf(resources, providers))
+    
     def generate_main_tf(self, resources: List[Dict], 
                           providers: Dict[str, Dict] = None) -> bool:
         """
         Generate the main.tf file with resources and providers.
         
+        Blocks are streamed to disk as they are rendered, so the whole file
+        is never held in memory at once.
+        
         Args:
             resources: List of resource configurations
             providers: Dictionary of provider configurations
@@ -186,21 +318,105 @@ class TerraformWriter:
         Returns:
             True if successful, False otherwise
         """
-        content = ""
+        return self._write_main_tf(self._iter_main_tf(resources, providers))
+    
+    def write_main_tf(self, content: str) -> bool:
+        """
+        Write already rendered HCL (e.g. from render_main_tf) to main.tf.
+        
+        Args:
+            content: HCL content for the whole file
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._write_main_tf((content,))
+    
+    def _write_main_tf(self, chunks: Iterable[str]) -> bool:
+        """
+        Write main.tf and remove the files of an earlier split.
+        
+        The chunks go to main.tf.tmp first, which replaces main.tf only once
+        all of them are written; a failure leaves the previous main.tf
+        untouched.
+        
+        Args:
+            chunks: HCL strings in file order
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        file_path = os.path.join(self.output_dir, "main.tf")
+        tmp_path = file_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', buffering=65536) as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            print(f"Error writing file main.tf: {e}")
+            self._remove_terraform_file("main.tf.tmp")
+            return False
+        
+        # Files from an earlier split would declare the same resources again
+        for filename in self._read_split_manifest():
+            self._remove_terraform_file(filename)
+        self._remove_terraform_file(_SPLIT_MANIFEST)
+        return True
+    
+    def generate_split_tf(self, resources: List[Dict], 
+                          providers: Dict[str, Dict] = None) -> bool:
+        """
+        Generate providers.tf plus one file per provider (e.g. aws.tf).
+        
+        Each file is rendered independently and all of them are written
+        concurrently, which keeps large configurations quick to save. The
+        written files are recorded in a manifest, and main.tf is only
+        removed once all of them succeeded.
+        
+        Args:
+            resources: List of resource configurations
+            providers: Dictionary of provider configurations
+            
+        Returns:
+            True if every file was written, False otherwise
+        """
+        files: Dict[str, List[str]] = {"providers.tf": []}
         
         # Add provider blocks
         if providers:
             for provider_name, provider_config in providers.items():
-                content += self.create_provider_block(provider_name, provider_config)
-                content += "\n"
+                files["providers.tf"].append(self.create_provider_block(provider_name, provider_config))
+                files["providers.tf"].append("\n")
         
-        # Add resource blocks
+        # Add resource blocks to their provider's file
         for resource in resources:
-            content += self.create_resource_block(
+            parts = files.setdefault(f"{self._provider_of(resource['type'])}.tf", [])
+            parts.append(self.create_resource_block(
                 resource["type"], 
                 resource["name"], 
                 resource["config"]
-            )
-            content += "\n"
+            ))
+            parts.append("\n")
+        
+        # Record the new files before writing them (keeping the previous
+        # entries) so a partly failed save can still be cleaned up later
+        previous = self._read_split_manifest()
+        tracked = dict.fromkeys(previous + list(files))
+        if not self.write_terraform_file(_SPLIT_MANIFEST, "\n".join(tracked) + "\n"):
+            return False
+        
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            results = executor.map(self.write_terraform_file, 
+                                   files.keys(), 
+                                   ("".join(parts) for parts in files.values()))
+            if not all(list(results)):
+                return False
         
-        return self.write_terraform_file("main.tf", content)
+        # Drop files of providers that are no longer used, and main.tf, which
+        # would declare the same resources a second time
+        for filename in previous:
+            if filename not in files:
+                self._remove_terraform_file(filename)
+        self._remove_terraform_file("main.tf")
+        return self.write_terraform_file(_SPLIT_MANIFEST, "\n".join(files) + "\n")
@@ -1,12 +1,15 @@
 """
 Main application window for the TerraScope GUI.
 """
+import copy
 import sys
+from functools import cached_property
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, 
                             QVBoxLayout, QHBoxLayout, QWidget, QPushButton,
-                            QLabel, QStatusBar, QMessageBox, QSplitter)
-from PyQt5.QtCore import Qt, QSize
-from PyQt5.QtGui import QIcon, QFont
+                            QLabel, QStatusBar, QMessageBox, QSplitter,
+                            QPlainTextEdit)
+from PyQt5.QtCore import Qt, QSize, QProcess, QProcessEnvironment, QTimer
+from PyQt5.QtGui import QIcon, QFont, QTextCursor
 
 # Import from our package
 from gui.drag_drop_canvas import DragDropCanvas
@@ -15,6 +18,12 @@ from core.resource_manager import ResourceManager
 from core.terraform_writer import TerraformWriter
 from core.terraform_runner import TerraformRunner
 
+# Provider configuration written alongside every design
+DEFAULT_PROVIDERS = {
+    "aws": {"region": "us-west-2"},
+    "azurerm": {"features": {}}
+}
+
 class AppWindow(QMainWindow):
     """Main application window for TerraScope."""
     
@@ -22,10 +31,18 @@ class AppWindow(QMainWindow):
         """Initialize the main application window."""
         super().__init__()
         
-        # Initialize backend components
+        # Initialize backend components (the canvas needs resources right away,
+        # the writer and runner are created on first use)
         self.resource_manager = ResourceManager()
-        self.terraform_writer = TerraformWriter()
-        self.terraform_runner = TerraformRunner()
+        
+        # Terraform process currently streaming into the output tab
+        self.terraform_process = None
+        
+        # Set by Cancel or the timeout so the killed process doesn't continue the chain
+        self._terraform_cancelled = False
+        
+        # (resources snapshot, HCL) from the last preview, reused by save
+        self._last_rendered = None
         
         # Set window properties
         self.setWindowTitle("TerraScope - Visual Terraform Builder")
@@ -34,6 +51,16 @@ class AppWindow(QMainWindow):
         # Setup UI
         self.setup_ui()
     
+    @cached_property
+    def terraform_writer(self):
+        """TerraformWriter created the first time HCL is generated."""
+        return TerraformWriter()
+    
+    @cached_property
+    def terraform_runner(self):
+        """TerraformRunner created the first time terraform is run."""
+        return TerraformRunner()
+    
     def setup_ui(self):
         """Set up the user interface."""
         # Create central widget and main layout
@@ -57,11 +84,16 @@ class AppWindow(QMainWindow):
         run_button = QPushButton("Run")
         run_button.clicked.connect(self.run_terraform)
         
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_terraform)
+        self.cancel_button.setEnabled(False)
+        
         header_layout.addWidget(title_label)
         header_layout.addStretch()
         header_layout.addWidget(save_button)
         header_layout.addWidget(generate_button)
         header_layout.addWidget(run_button)
+        header_layout.addWidget(self.cancel_button)
         
         # Create main content area with splitter
         splitter = QSplitter(Qt.Horizontal)
@@ -73,24 +105,27 @@ class AppWindow(QMainWindow):
         self.canvas = DragDropCanvas(self.resource_manager)
         tabs.addTab(self.canvas, "Canvas")
         
+        # Preview and output share one monospace font
+        code_font = QFont("Courier New", 10)
+        
         # Preview tab
         preview_widget = QWidget()
         preview_layout = QVBoxLayout(preview_widget)
-        self.preview_label = QLabel("Terraform code will appear here...")
-        self.preview_label.setAlignment(Qt.AlignTop)
-        self.preview_label.setWordWrap(True)
-        self.preview_label.setFont(QFont("Courier New", 10))
-        preview_layout.addWidget(self.preview_label)
+        self.preview_text = QPlainTextEdit()
+        self.preview_text.setReadOnly(True)
+        self.preview_text.setPlaceholderText("Terraform code will appear here...")
+        self.preview_text.setFont(code_font)
+        preview_layout.addWidget(self.preview_text)
         tabs.addTab(preview_widget, "Preview")
         
         # Output tab
         output_widget = QWidget()
         output_layout = QVBoxLayout(output_widget)
-        self.output_label = QLabel("Terraform output will appear here...")
-        self.output_label.setAlignment(Qt.AlignTop)
-        self.output_label.setWordWrap(True)
-        self.output_label.setFont(QFont("Courier New", 10))
-        output_layout.addWidget(self.output_label)
+        self.output_text = QPlainTextEdit()
+        self.output_text.setReadOnly(True)
+        self.output_text.setPlaceholderText("Terraform output will appear here...")
+        self.output_text.setFont(code_font)
+        output_layout.addWidget(self.output_text)
         tabs.addTab(output_widget, "Output")
         
         # Create form area
@@ -105,6 +140,8 @@ class AppWindow(QMainWindow):
         
         # Set up connections between components
         self.canvas.resource_selected.connect(self.form_generator.load_resource_form)
+        self.form_generator.resource_updated.connect(self.canvas.update_resource_config)
+        self.canvas.resource_removed.connect(self.form_generator.on_resource_removed)
         
         # Add widgets to main layout
         main_layout.addWidget(header)
@@ -121,12 +158,12 @@ class AppWindow(QMainWindow):
     def save_terraform(self):
         """Save the current Terraform configuration."""
         resources = self.canvas.get_resources()
-        providers = {
-            "aws": {"region": "us-west-2"},
-            "azurerm": {"features": {}}
-        }
         
-        success = self.terraform_writer.generate_main_tf(resources, providers)
+        if self._last_rendered is not None and self._last_rendered[0] == resources:
+            # Nothing changed since the preview, write the HCL it rendered
+            success = self.terraform_writer.write_main_tf(self._last_rendered[1])
+        else:
+            success = self.terraform_writer.generate_main_tf(resources, DEFAULT_PROVIDERS)
         
         if success:
             self.status_bar.showMessage("Terraform configuration saved successfully")
@@ -142,62 +179,148 @@ class AppWindow(QMainWindow):
             self.status_bar.showMessage("No resources to generate")
             return
         
-        providers = {
-            "aws": {"region": "us-west-2"},
-            "azurerm": {"features": {}}
-        }
+        content = self.terraform_writer.render_main_tf(resources, DEFAULT_PROVIDERS)
         
-        content = ""
+        # Snapshot the resources so later edits on the canvas invalidate it
+        self._last_rendered = (copy.deepcopy(resources), content)
         
-        # Add provider blocks
-        for provider_name, provider_config in providers.items():
-            content += self.terraform_writer.create_provider_block(provider_name, provider_config)
-            content += "\n"
-        
-        # Add resource blocks
-        for resource in resources:
-            content += self.terraform_writer.create_resource_block(
-                resource["type"], 
-                resource["name"], 
-                resource["config"]
-            )
-            content += "\n"
-        
-        self.preview_label.setText(content)
+        self.preview_text.setPlainText(content)
         self.status_bar.showMessage("Terraform code generated")
     
     def run_terraform(self):
         """Run Terraform commands on the generated configuration."""
+        if self.terraform_process is not None:
+            self.status_bar.showMessage("Terraform is already running")
+            return
+        
         # First save the configuration
         self.save_terraform()
         
-        # Run terraform init
-        success, message = self.terraform_runner.init()
-        self.output_label.setText(message)
+        # Chain init -> plan -> apply through the finished callbacks so the
+        # event loop keeps running while terraform works
+        self.output_text.clear()
+        self.start_terraform(self.terraform_runner.init_args(), self._on_init_finished)
+    
+    def start_terraform(self, args, on_finished):
+        """
+        Start a terraform command without blocking the GUI.
+        
+        Args:
+            args: Terraform arguments (e.g., ["init", "-no-color"])
+            on_finished: Callback receiving True if the command succeeded
+        """
+        environment = QProcessEnvironment()
+        for key, value in self.terraform_runner.env.items():
+            environment.insert(key, value)
+        
+        process = QProcess(self)
+        process.setWorkingDirectory(self.terraform_runner.working_dir)
+        process.setProcessEnvironment(environment)
+        process.setProcessChannelMode(QProcess.MergedChannels)
+        process.readyReadStandardOutput.connect(self._append_process_output)
+        process.finished.connect(
+            lambda code, status: self._on_process_finished(
+                code == 0 and status == QProcess.NormalExit, on_finished)
+        )
+        process.errorOccurred.connect(self._on_process_error)
+        
+        # Kill a hung command after the runner's timeout, like run_command does
+        if self.terraform_runner.timeout is not None:
+            timer = QTimer(process)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda: self._on_process_timeout(process))
+            timer.start(int(self.terraform_runner.timeout * 1000))
         
+        self.terraform_process = process
+        self._terraform_cancelled = False
+        self.cancel_button.setEnabled(True)
+        self.status_bar.showMessage(f"Running: terraform {' '.join(args)}")
+        process.start("terraform", args)
+    
+    def cancel_terraform(self):
+        """Kill the running terraform command."""
+        if self.terraform_process is not None:
+            self._terraform_cancelled = True
+            self.terraform_process.kill()
+            self.status_bar.showMessage("Terraform command cancelled")
+    
+    def _on_process_timeout(self, process):
+        """Kill a terraform command that is still running when its timeout expires."""
+        if process is self.terraform_process:
+            self._terraform_cancelled = True
+            process.kill()
+            self.status_bar.showMessage(
+                f"Terraform command timed out after {self.terraform_runner.timeout} seconds")
+    
+    def _append_process_output(self):
+        """Append newly available terraform output to the output tab."""
+        if self.terraform_process is None:
+            return
+        chunk = bytes(self.terraform_process.readAllStandardOutput()).decode(errors="replace")
+        # Insert at the end rather than appendPlainText, which would start a
+        # new paragraph for every chunk even when it continues a line
+        self.output_text.moveCursor(QTextCursor.End)
+        self.output_text.insertPlainText(chunk)
+    
+    def _on_process_finished(self, success, on_finished):
+        """
+        Release the finished process and continue the command chain.
+        
+        A cancelled command ends the chain without calling on_finished.
+        
+        Args:
+            success: Whether the command exited with code 0
+            on_finished: Callback receiving the success flag
+        """
+        self._append_process_output()
+        self.terraform_process.deleteLater()
+        self.terraform_process = None
+        self.cancel_button.setEnabled(False)
+        if self._terraform_cancelled:
+            return
+        on_finished(success)
+    
+    def _on_process_error(self, error):
+        """Handle terraform failing to start (finished is not emitted then)."""
+        if error == QProcess.FailedToStart and self.terraform_process is not None:
+            self.output_text.setPlainText(self.terraform_process.errorString())
+            self.terraform_process.deleteLater()
+            self.terraform_process = None
+            self.cancel_button.setEnabled(False)
+            self.status_bar.showMessage("Failed to start terraform")
+    
+    def _on_init_finished(self, success):
+        """Run terraform plan once init has succeeded."""
+        if not success:
+            self.status_bar.showMessage("Terraform init failed")
+            return
+        self.start_terraform(self.terraform_runner.plan_args(out_file=TerraformRunner.PLAN_FILE),
+                             self._on_plan_finished)
+    
+    def _on_plan_finished(self, success):
+        """Ask for confirmation and run terraform apply once plan has succeeded."""
+        if not success:
+            self.status_bar.showMessage("Terraform plan failed")
+            return
+        
+        reply = QMessageBox.question(
+            self, 
+            "Apply Configuration",
+            "Do you want to apply this configuration?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        if reply == QMessageBox.Yes:
+            # Apply the reviewed plan rather than computing a new one
+            self.start_terraform(self.terraform_runner.apply_args(plan_file=TerraformRunner.PLAN_FILE),
+                                 self._on_apply_finished)
+        else:
+            self.status_bar.showMessage("Terraform plan completed")
+    
+    def _on_apply_finished(self, success):
+        """Report the result of terraform apply."""
         if success:
-            # Run terraform plan
-            success, message = self.terraform_runner.plan()
-            self.output_label.setText(message)
-            
-            if success:
-                reply = QMessageBox.question(
-                    self, 
-                    "Apply Configuration",
-                    "Do you want to apply this configuration?",
-                    QMessageBox.Yes | QMessageBox.No,
-                    QMessageBox.No
-                )
-                
-                if reply == QMessageBox.Yes:
-                    success, message = self.terraform_runner.apply(auto_approve=True)
-                    self.output_label.setText(message)
-                    
-                    if success:
-                        self.status_bar.showMessage("Terraform apply completed successfully")
-                    else:
-                        self.status_bar.showMessage("Terraform apply failed")
-            else:
-                self.status_bar.showMessage("Terraform plan failed")
+            self.status_bar.showMessage("Terraform apply completed successfully")
         else:
-            self.status_bar.showMessage("Terraform init failed")
\ No newline at end of file
+            self.status_bar.showMessage("Terraform apply failed")
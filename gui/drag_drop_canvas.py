@@ -1,135 +1,226 @@
 """
 Canvas for dragging and dropping infrastructure resources.
 """
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                            QScrollArea, QFrame, QPushButton, QMenu, QAction,
-                            QListWidget, QListWidgetItem)
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QDrag, QPixmap, QPainter, QColor, QFont
+import copy
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QMenu,
+                            QListWidget, QListWidgetItem, QGraphicsView,
+                            QGraphicsScene, QGraphicsItem, QStyle)
+from PyQt5.QtCore import Qt, QRectF, QPointF, QTimer, pyqtSignal
+from PyQt5.QtGui import (QPainter, QColor, QFont, QPen, QBrush, QFontMetrics,
+                         QStaticText, QTransform)
 
-class ResourceItem(QFrame):
+logger = logging.getLogger(__name__)
+
+# Resources added without a drop position are laid out on a grid
+SLOT_COLUMNS = 3
+SLOT_SPACING = 20
+
+# Painting resources, created once and shared by every item
+_CARD_PEN = QPen(QColor("#4682b4"), 2)
+_CARD_SELECTED_PEN = QPen(QColor("#4682b4"), 3)
+_CARD_BRUSH = QBrush(QColor("#f0f8ff"))
+_TEXT_PEN = QPen(QColor("#000000"))
+_CATEGORY_BACKGROUND = QColor("#f0f0f0")
+_CANVAS_STYLE = "background-color: #f9f9f9; border: 1px dashed #cccccc;"
+
+# Defaults of resource types without a template
+_NO_DEFAULTS = MappingProxyType({})
+
+@lru_cache(maxsize=None)
+def _font(point_size, bold=False):
+    """
+    Get the shared Arial font of a size.
+    
+    Built on first use rather than at import, since fonts need the
+    QApplication to exist.
+    
+    Args:
+        point_size: Font size in points
+        bold: Whether the font is bold
+        
+    Returns:
+        QFont instance
+    """
+    return QFont("Arial", point_size, QFont.Bold if bold else QFont.Normal)
+
+class ResourceItem(QGraphicsItem):
     """Represents a resource on the canvas."""
     
-    def __init__(self, resource_type, resource_name, parent=None):
+    WIDTH = 220
+    HEIGHT = 60
+    
+    def __init__(self, resource_type, resource_name, canvas, defaults=_NO_DEFAULTS):
         """
         Initialize a resource item.
         
         Args:
             resource_type: Type of resource (e.g., "aws_s3_bucket")
             resource_name: Name/identifier for the resource
-            parent: Parent widget
+            canvas: DragDropCanvas the item belongs to
+            defaults: Read-only default configuration shared by the type
         """
-        super().__init__(parent)
+        super().__init__()
         
         self.resource_type = resource_type
         self.resource_name = resource_name
-        self.config = {}
+        self.canvas = canvas
         
-        # Set up UI
-        self.setFrameShape(QFrame.StyledPanel)
-        self.setLineWidth(2)
-        self.setMinimumSize(200, 100)
-        self.setMaximumSize(300, 150)
-        self.setStyleSheet(
-            "ResourceItem {"
-            "   background-color: #f0f8ff;"
-            "   border: 2px solid #4682b4;"
-            "   border-radius: 5px;"
-            "}"
-        )
-        
-        layout = QVBoxLayout(self)
+        # Only values that differ from the shared defaults are stored
+        self._defaults = defaults
+        self.config_overrides = {}
         
-        # Resource type
-        type_label = QLabel(resource_type)
-        type_label.setFont(QFont("Arial", 10, QFont.Bold))
-        layout.addWidget(type_label)
+        # Elided, pre-laid-out type and name labels, built on first paint
+        self._labels = None
         
-        # Resource name
-        name_label = QLabel(resource_name)
-        layout.addWidget(name_label)
+        # Moving is handled by the scene, no QDrag needed
+        self.setFlags(QGraphicsItem.ItemIsMovable | QGraphicsItem.ItemIsSelectable)
+        
+        # Paint once into a pixmap held in QPixmapCache and blit it while the
+        # item is dragged around; update() (e.g. on selection) repaints it
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+    
+    @property
+    def config(self):
+        """Full configuration: the type's defaults merged with the overrides."""
+        # MappingProxyType only freezes the top level; copy the nested values
+        # (e.g. tags) so callers editing them can't change the shared defaults
+        return copy.deepcopy({**self._defaults, **self.config_overrides})
+    
+    @config.setter
+    def config(self, config):
+        """Keep only the values of config that differ from the defaults."""
+        if self._defaults.keys() <= config.keys():
+            self.config_overrides = {key: value for key, value in config.items()
+                                     if key not in self._defaults or self._defaults[key] != value}
+        else:
+            # A default was dropped, so the defaults no longer apply
+            self._defaults = _NO_DEFAULTS
+            self.config_overrides = dict(config)
+    
+    def boundingRect(self):
+        """Return the area the item paints in."""
+        return QRectF(0, 0, self.WIDTH, self.HEIGHT)
+    
+    def paint(self, painter, option, widget=None):
+        """Draw the resource card directly instead of composing child widgets."""
+        selected = option.state & QStyle.State_Selected
         
-        # Buttons
-        button_layout = QHBoxLayout()
-        edit_button = QPushButton("Edit")
-        edit_button.clicked.connect(self.edit_resource)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(_CARD_SELECTED_PEN if selected else _CARD_PEN)
+        painter.setBrush(_CARD_BRUSH)
+        painter.drawRoundedRect(self.boundingRect().adjusted(1, 1, -1, -1), 5, 5)
         
-        delete_button = QPushButton("Delete")
-        delete_button.clicked.connect(self.remove_from_canvas)
+        if self._labels is None:
+            self._labels = (self._static_text(self.resource_type, _font(10, bold=True)),
+                            self._static_text(self.resource_name, _font(10)))
+        type_text, name_text = self._labels
+        painter.setPen(_TEXT_PEN)
         
-        button_layout.addWidget(edit_button)
-        button_layout.addWidget(delete_button)
-        layout.addLayout(button_layout)
+        # Resource type
+        painter.setFont(_font(10, bold=True))
+        painter.drawStaticText(QPointF(10, 10), type_text)
+        
+        # Resource name
+        painter.setFont(_font(10))
+        painter.drawStaticText(QPointF(10, 34), name_text)
+    
+    def _static_text(self, text, font):
+        """
+        Lay out a label once so repaints skip text shaping.
+        
+        Args:
+            text: Label text, elided to the card width
+            font: Font the label is drawn with
+            
+        Returns:
+            Prepared QStaticText
+        """
+        static_text = QStaticText(QFontMetrics(font).elidedText(text, Qt.ElideRight, self.WIDTH - 20))
+        static_text.setTextFormat(Qt.PlainText)
+        static_text.prepare(QTransform(), font)
+        return static_text
+    
+    def contextMenuEvent(self, event):
+        """Offer Edit and Delete actions on right-click."""
+        menu = QMenu()
+        edit_action = menu.addAction("Edit")
+        delete_action = menu.addAction("Delete")
+        
+        chosen = menu.exec_(event.screenPos())
+        if chosen is edit_action:
+            self.edit_resource()
+        elif chosen is delete_action:
+            self.remove_from_canvas()
+    
+    def mouseDoubleClickEvent(self, event):
+        """Edit the resource on double-click."""
+        self.edit_resource()
     
     def edit_resource(self):
         """Emit signal to edit this resource."""
-        if hasattr(self.parent(), "resource_selected"):
-            self.parent().resource_selected.emit(self.resource_type, self.resource_name, self.config)
+        self.canvas.resource_selected.emit(self.resource_type, self.resource_name, self.config)
     
     def remove_from_canvas(self):
         """Remove this resource from the canvas."""
-        if hasattr(self.parent(), "remove_resource"):
-            self.parent().remove_resource(self)
-    
-    def mousePressEvent(self, event):
-        """Handle mouse press events for dragging."""
-        if event.button() == Qt.LeftButton:
-            # Create a drag object
-            drag = QDrag(self)
-            
-            # Create a pixmap for dragging
-            pixmap = QPixmap(self.size())
-            pixmap.fill(Qt.transparent)
-            
-            painter = QPainter(pixmap)
-            painter.setOpacity(0.7)
-            self.render(painter)
-            painter.end()
-            
-            drag.setPixmap(pixmap)
-            drag.setHotSpot(event.pos())
-            
-            # Start the drag
-            drag.exec_(Qt.MoveAction)
+        self.canvas.remove_resource(self)
 
-class DropArea(QWidget):
-    """Custom widget for handling drops from the resource list."""
+class DropArea(QGraphicsView):
+    """Custom view for handling drops from the resource list."""
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
         self.canvas = parent
+        
+        # Resources are few and moved often, so skip the BSP index the
+        # scene would otherwise rebuild on every move, add and removal
+        scene = QGraphicsScene(self)
+        scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.setScene(scene)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setRenderHint(QPainter.Antialiasing)
+        
+        # Scrolling blits the cached background, and items set their own
+        # pen, brush and font so the painter state need not be saved
+        self.setCacheMode(QGraphicsView.CacheBackground)
+        self.setOptimizationFlag(QGraphicsView.DontSavePainterState)
     
     def dragEnterEvent(self, event):
         """Handle drag enter events."""
-        print("Drag enter event received in DropArea")
-        if event.mimeData().hasFormat("application/x-qabstractitemmodeldatalist"):
-            print("Accepting drag with application/x-qabstractitemmodeldatalist")
+        # Fires repeatedly during a drag, so only log when debugging
+        mime_data = event.mimeData()
+        if mime_data.hasFormat("application/x-qabstractitemmodeldatalist"):
             event.acceptProposedAction()
-        elif event.mimeData().hasText():
-            print("Accepting drag with text")
+        elif mime_data.hasText():
             event.acceptProposedAction()
-        else:
-            print(f"Available formats: {event.mimeData().formats()}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Rejecting drag with formats %s", mime_data.formats())
+    
+    def dragMoveEvent(self, event):
+        """Keep accepting the drag; the default forwards it to the scene, which would reject it."""
+        event.acceptProposedAction()
     
     def dropEvent(self, event):
         """Handle drop events."""
-        print("Drop event received in DropArea")
         if self.canvas and hasattr(self.canvas, 'resource_list'):
             # Get selected items from the parent canvas's resource list
             items = self.canvas.resource_list.selectedItems()
             if items:
-                print(f"Selected items: {len(items)}")
                 resource_type = items[0].data(Qt.UserRole)
-                print(f"Resource type: {resource_type}")
-                resource_name = f"{resource_type.split('_')[-1]}_{len(self.canvas.resources)}"
-                self.canvas.add_resource(resource_type, resource_name)
+                logger.debug("Dropped resource type %s", resource_type)
+                self.canvas.add_resource(resource_type, self.canvas.next_name(resource_type),
+                                         self.mapToScene(event.pos()))
         event.acceptProposedAction()
 
 class DragDropCanvas(QWidget):
     """Canvas for dragging and dropping resources."""
     
     resource_selected = pyqtSignal(str, str, dict)
+    resource_removed = pyqtSignal(str, str)
     
     def __init__(self, resource_manager, parent=None):
         """
@@ -144,6 +235,16 @@ class DragDropCanvas(QWidget):
         self.resource_manager = resource_manager
         self.resources = []
         
+        # (resource_type, resource_name) -> ResourceItem, for O(1) lookups
+        self._resource_index = {}
+        
+        # Per-type counters and name suffixes (e.g. "bucket") for new names
+        self._type_counters = defaultdict(int)
+        self._type_suffix = {}
+        
+        # Read-only default configuration per resource type
+        self._defaults_cache = {}
+        
         # Set up UI
         main_layout = QHBoxLayout(self)
         
@@ -152,39 +253,17 @@ class DragDropCanvas(QWidget):
         resource_layout = QVBoxLayout(resource_panel)
         
         resource_label = QLabel("Resources")
-        resource_label.setFont(QFont("Arial", 12, QFont.Bold))
+        resource_label.setFont(_font(12, bold=True))
         resource_layout.addWidget(resource_label)
         
         self.resource_list = QListWidget()
         self.resource_list.setDragEnabled(True)
         
-        # Load resource types
-        aws_resources = self.resource_manager.get_resources_by_provider("aws")
-        azure_resources = self.resource_manager.get_resources_by_provider("azurerm")
-        
-        # Add AWS resources
-        aws_category = QListWidgetItem("AWS")
-        aws_category.setFont(QFont("Arial", 10, QFont.Bold))
-        aws_category.setFlags(Qt.NoItemFlags)
-        aws_category.setBackground(QColor("#f0f0f0"))
-        self.resource_list.addItem(aws_category)
-        
-        for resource_type in aws_resources:
-            item = QListWidgetItem(resource_type)
-            item.setData(Qt.UserRole, resource_type)
-            self.resource_list.addItem(item)
-        
-        # Add Azure resources
-        azure_category = QListWidgetItem("Azure")
-        azure_category.setFont(QFont("Arial", 10, QFont.Bold))
-        azure_category.setFlags(Qt.NoItemFlags)
-        azure_category.setBackground(QColor("#f0f0f0"))
-        self.resource_list.addItem(azure_category)
-        
-        for resource_type in azure_resources:
-            item = QListWidgetItem(resource_type)
-            item.setData(Qt.UserRole, resource_type)
-            self.resource_list.addItem(item)
+        # Every row is one line of text, so rows need not be measured one by one
+        self.resource_list.setUniformItemSizes(True)
+        
+        # Fill the list once the event loop runs, after the window is shown
+        QTimer.singleShot(0, self._populate_resource_list)
         
         resource_layout.addWidget(self.resource_list)
         
@@ -193,25 +272,17 @@ class DragDropCanvas(QWidget):
         canvas_layout = QVBoxLayout(canvas_container)
         
         canvas_label = QLabel("Design Canvas")
-        canvas_label.setFont(QFont("Arial", 12, QFont.Bold))
+        canvas_label.setFont(_font(12, bold=True))
         canvas_layout.addWidget(canvas_label)
         
-        # Use custom DropArea instead of regular QWidget
+        # Resources are lightweight items in a graphics scene rather than
+        # widgets in a layout; the view scrolls on its own
         self.canvas_area = DropArea(self)
         self.canvas_area.setMinimumSize(600, 400)
-        self.canvas_area.setStyleSheet(
-            "background-color: #f9f9f9; border: 1px dashed #cccccc;"
-        )
-        
-        # Use a scroll area to allow scrolling if many resources are added
-        scroll_area = QScrollArea()
-        scroll_area.setWidget(self.canvas_area)
-        scroll_area.setWidgetResizable(True)
-        canvas_layout.addWidget(scroll_area)
-        
-        # Set canvas layout
-        self.canvas_layout = QVBoxLayout(self.canvas_area)
-        self.canvas_layout.setAlignment(Qt.AlignTop)
+        self.canvas_area.setStyleSheet(_CANVAS_STYLE)
+        self.scene = self.canvas_area.scene()
+        self._next_slot = 0
+        canvas_layout.addWidget(self.canvas_area)
         
         # Connect resource list double-click event
         self.resource_list.itemDoubleClicked.connect(self.handle_double_click)
@@ -220,33 +291,111 @@ class DragDropCanvas(QWidget):
         main_layout.addWidget(resource_panel, 1)
         main_layout.addWidget(canvas_container, 3)
     
+    def _populate_resource_list(self):
+        """Add the category headers and resource types to the resource list."""
+        # Populate the list in one batch, without repaints, sorting or
+        # signals after every item
+        sorting_enabled = self.resource_list.isSortingEnabled()
+        self.resource_list.setUpdatesEnabled(False)
+        self.resource_list.setSortingEnabled(False)
+        self.resource_list.blockSignals(True)
+        
+        grouped = self.resource_manager.get_all_resources_grouped()
+        for category_label, provider in (("AWS", "aws"), ("Azure", "azurerm")):
+            # Add the provider's category header
+            category = QListWidgetItem(category_label)
+            category.setFont(_font(10, bold=True))
+            category.setFlags(Qt.NoItemFlags)
+            category.setBackground(_CATEGORY_BACKGROUND)
+            self.resource_list.addItem(category)
+            
+            # Add the provider's resources, then attach their types
+            first_row = self.resource_list.count()
+            resource_types = grouped.get(provider, [])
+            self.resource_list.addItems(resource_types)
+            for row, resource_type in enumerate(resource_types, first_row):
+                self.resource_list.item(row).setData(Qt.UserRole, resource_type)
+        
+        self.resource_list.blockSignals(False)
+        self.resource_list.setSortingEnabled(sorting_enabled)
+        self.resource_list.setUpdatesEnabled(True)
+    
     def handle_double_click(self, item):
         """Handle double-click on resource list items."""
         if item.data(Qt.UserRole):  # Ensure item has resource_type data
             resource_type = item.data(Qt.UserRole)
-            self.add_resource(resource_type, f"{resource_type.split('_')[-1]}_{len(self.resources)}")
+            self.add_resource(resource_type, self.next_name(resource_type))
+    
+    def next_name(self, resource_type):
+        """
+        Get the name for the next resource of a type.
+        
+        Counters only grow, so names stay unique after resources are removed.
+        
+        Args:
+            resource_type: Type of resource (e.g., "aws_s3_bucket")
+            
+        Returns:
+            Resource name (e.g., "bucket_0")
+        """
+        suffix = self._type_suffix.get(resource_type)
+        if suffix is None:
+            suffix = self._type_suffix[resource_type] = resource_type.rsplit("_", 1)[-1]
+        return f"{suffix}_{self._type_counters[resource_type]}"
     
-    def add_resource(self, resource_type, resource_name):
+    def add_resource(self, resource_type, resource_name, pos=None):
         """
         Add a resource to the canvas.
         
         Args:
             resource_type: Type of resource
             resource_name: Name for the resource
+            pos: Scene position for the resource (next grid slot if None)
         """
-        resource_item = ResourceItem(resource_type, resource_name, self)
+        # Start from the default configuration shared by the type
+        resource_item = ResourceItem(resource_type, resource_name, self, self._get_defaults(resource_type))
+        self._type_counters[resource_type] += 1
         
-        # Get default configuration from the resource manager
-        template = self.resource_manager.get_resource_template(resource_type)
-        if template and "defaults" in template:
-            resource_item.config = template["defaults"].copy()
-        
-        self.canvas_layout.addWidget(resource_item)
+        resource_item.setPos(pos if pos is not None else self._next_slot_position())
+        self.scene.addItem(resource_item)
         self.resources.append(resource_item)
+        self._resource_index[(resource_type, resource_name)] = resource_item
         
         # Select the newly added resource
         self.resource_selected.emit(resource_type, resource_name, resource_item.config)
     
+    def _get_defaults(self, resource_type):
+        """
+        Get the default configuration of a resource type.
+        
+        The template is looked up once per type and the frozen snapshot is
+        shared by its items, which only store their own overrides.
+        
+        Args:
+            resource_type: Type of resource
+            
+        Returns:
+            Read-only mapping of default values
+        """
+        defaults = self._defaults_cache.get(resource_type)
+        if defaults is None:
+            template = self.resource_manager.get_resource_template(resource_type)
+            defaults = MappingProxyType(copy.deepcopy(template.get("defaults", {}))) if template else _NO_DEFAULTS
+            self._defaults_cache[resource_type] = defaults
+        return defaults
+    
+    def _next_slot_position(self):
+        """
+        Get the position of the next free grid slot.
+        
+        Returns:
+            QPointF in scene coordinates
+        """
+        row, column = divmod(self._next_slot, SLOT_COLUMNS)
+        self._next_slot += 1
+        return QPointF(SLOT_SPACING + column * (ResourceItem.WIDTH + SLOT_SPACING),
+                       SLOT_SPACING + row * (ResourceItem.HEIGHT + SLOT_SPACING))
+    
     def remove_resource(self, resource_item):
         """
         Remove a resource from the canvas.
@@ -254,9 +403,23 @@ class DragDropCanvas(QWidget):
         Args:
             resource_item: ResourceItem to remove
         """
-        self.canvas_layout.removeWidget(resource_item)
+        self.scene.removeItem(resource_item)
         self.resources.remove(resource_item)
-        resource_item.deleteLater()
+        self._resource_index.pop((resource_item.resource_type, resource_item.resource_name), None)
+        self.resource_removed.emit(resource_item.resource_type, resource_item.resource_name)
+    
+    def update_resource_config(self, resource_type, resource_name, config):
+        """
+        Replace the configuration of a resource on the canvas.
+        
+        Args:
+            resource_type: Type of resource
+            resource_name: Name of the resource
+            config: New configuration
+        """
+        resource_item = self._resource_index.get((resource_type, resource_name))
+        if resource_item is not None:
+            resource_item.config = config
     
     def get_resources(self):
         """
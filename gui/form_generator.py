@@ -1,14 +1,148 @@
 """
 Dynamically generates forms for editing resource properties.
 """
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QLabel, 
-                           QLineEdit, QComboBox, QCheckBox, QScrollArea,
-                           QPushButton, QSpinBox, QDoubleSpinBox, QGroupBox)
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, QComboBox,
+                           QCheckBox, QPushButton, QSpinBox, QDoubleSpinBox,
+                           QTreeView, QStyledItemDelegate, QAbstractItemView)
 from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
+
+# Options offered for well-known fields, shared by every form
+INSTANCE_TYPES = ("t2.micro", "t2.small", "t2.medium", "t3.micro", "t3.small", "t3.medium")
+ACCOUNT_TIERS = ("Standard", "Premium")
+REPLICATION_TYPES = ("LRS", "GRS", "RAGRS", "ZRS", "GZRS", "RAGZRS")
+AWS_REGIONS = (
+    "us-east-1", "us-east-2", "us-west-1", "us-west-2",
+    "eu-west-1", "eu-west-2", "eu-central-1",
+    "ap-northeast-1", "ap-northeast-2", "ap-southeast-1", "ap-southeast-2"
+)
+AZURE_LOCATIONS = (
+    "East US", "East US 2", "Central US", "West US", "West US 2",
+    "North Europe", "West Europe", "UK South", "UK West",
+    "East Asia", "Southeast Asia", "Australia East"
+)
+
+# Pixels scrolled per wheel/arrow step in the form
+FORM_SCROLL_STEP = 20
+
+# Item data role holding the config key a value cell edits
+FIELD_KEY_ROLE = Qt.UserRole
+
+# Value types kept as-is in the model, anything else is edited as text
+_MODEL_VALUE_TYPES = (bool, int, float, str)
+
+def _make_checkbox(key, value):
+    """Checkbox for boolean values."""
+    widget = QCheckBox()
+    widget.setChecked(value)
+    return widget
+
+def _make_spinbox(key, value):
+    """Spin box for integer values."""
+    widget = QSpinBox()
+    widget.setRange(-2147483648, 2147483647)
+    widget.setValue(value)
+    return widget
+
+def _make_double_spinbox(key, value):
+    """Double spin box for float values."""
+    widget = QDoubleSpinBox()
+    widget.setRange(-2147483648, 2147483647)
+    widget.setValue(value)
+    return widget
+
+def _make_line_edit(key, value):
+    """Line edit for strings and any other value."""
+    return QLineEdit(value if isinstance(value, str) else str(value))
+
+def _make_combo(options):
+    """
+    Make a factory for combo boxes offering fixed options.
+    
+    Args:
+        options: Option strings
+        
+    Returns:
+        Widget factory taking (key, value)
+    """
+    def factory(key, value):
+        widget = QComboBox()
+        widget.addItems(options)
+        
+        # Set current value
+        index = widget.findText(value)
+        if index >= 0:
+            widget.setCurrentIndex(index)
+        return widget
+    return factory
+
+def _make_value_combo(key, value):
+    """Generic combo holding the current value."""
+    widget = QComboBox()
+    widget.addItem(value)
+    return widget
+
+# String fields with known options
+_STRING_SPECIAL = {
+    "instance_type": _make_combo(INSTANCE_TYPES),
+    "account_tier": _make_combo(ACCOUNT_TIERS),
+    "account_replication_type": _make_combo(REPLICATION_TYPES),
+    "region": _make_combo(AWS_REGIONS),
+    "location": _make_combo(AZURE_LOCATIONS),
+}
+
+# Other string fields edited with a combo box (as are keys ending in "_type")
+_COMBO_KEYS = frozenset(("tier", "size", "type"))
+
+def _make_string_widget(key, value):
+    """Combo box for type selections and regions, line edit otherwise."""
+    factory = _STRING_SPECIAL.get(key)
+    if factory is not None:
+        return factory(key, value)
+    if key.endswith("_type") or key in _COMBO_KEYS:
+        return _make_value_combo(key, value)
+    return _make_line_edit(key, value)
+
+# Widget factory per value type; other types fall back to a line edit
+_TYPE_DISPATCH = {
+    bool: _make_checkbox,
+    int: _make_spinbox,
+    float: _make_double_spinbox,
+    str: _make_string_widget,
+}
+
+class FieldDelegate(QStyledItemDelegate):
+    """Creates editors for value cells only when they are edited."""
+    
+    def __init__(self, form_generator):
+        """
+        Initialize the delegate.
+        
+        Args:
+            form_generator: FormGenerator providing the field widgets
+        """
+        super().__init__(form_generator)
+        self.form_generator = form_generator
+    
+    def createEditor(self, parent, option, index):
+        """Build the widget create_field_widget would use for the field."""
+        widget = self.form_generator.create_field_widget(index.data(FIELD_KEY_ROLE), index.data(Qt.EditRole))
+        widget.setParent(parent)
+        return widget
+    
+    def setEditorData(self, editor, index):
+        """Show the model value in the editor."""
+        self.form_generator.set_widget_value(editor, index.data(Qt.EditRole))
+    
+    def setModelData(self, editor, model, index):
+        """Write the editor value back to the model."""
+        model.setData(index, self.form_generator.get_widget_value(editor), Qt.EditRole)
 
 class FormGenerator(QWidget):
     """Generates and manages forms for editing resource properties."""
     
+    resource_updated = pyqtSignal(str, str, dict)
+    
     def __init__(self, parent=None):
         """
         Initialize the form generator.
@@ -21,6 +155,8 @@ class FormGenerator(QWidget):
         self.current_resource = None
         self.current_resource_type = None
         self.current_resource_name = None
+        
+        # Dotted field path -> value item in the model
         self.form_fields = {}
         
         # Set up UI
@@ -30,25 +166,33 @@ class FormGenerator(QWidget):
         self.title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(self.title_label)
         
-        # Scroll area for the form
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        layout.addWidget(scroll_area)
+        # Fields are model rows; the view only paints the visible ones and
+        # the delegate creates an editor widget when a value is edited
+        self.model = QStandardItemModel(self)
+        self.model.setHorizontalHeaderLabels(["Property", "Value"])
         
-        self.form_container = QWidget()
-        self.form_layout = QFormLayout(self.form_container)
+        self.tree_view = QTreeView()
+        self.tree_view.setModel(self.model)
+        self.tree_view.setItemDelegateForColumn(1, FieldDelegate(self))
+        self.tree_view.setEditTriggers(QAbstractItemView.AllEditTriggers)
         
-        scroll_area.setWidget(self.form_container)
+        # Rows are single lines, so the view can lay them out without
+        # measuring each one and scroll without relayout
+        self.tree_view.setUniformRowHeights(True)
+        self.tree_view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.tree_view.verticalScrollBar().setSingleStep(FORM_SCROLL_STEP)
+        self.tree_view.setVisible(False)
+        layout.addWidget(self.tree_view)
+        
+        # Empty state
+        self.empty_label = QLabel("Select a resource to edit its properties")
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.empty_label, 1)
         
         # Add apply button
         self.apply_button = QPushButton("Apply Changes")
         self.apply_button.clicked.connect(self.apply_changes)
         layout.addWidget(self.apply_button)
-        
-        # Empty state
-        self.empty_label = QLabel("Select a resource to edit its properties")
-        self.empty_label.setAlignment(Qt.AlignCenter)
-        self.form_layout.addWidget(self.empty_label)
     
     def load_resource_form(self, resource_type, resource_name, config):
         """
@@ -59,9 +203,6 @@ class FormGenerator(QWidget):
             resource_name: Name of the resource
             config: Current configuration
         """
-        # Clear existing form
-        self.clear_form()
-        
         # Update current resource info
         self.current_resource_type = resource_type
         self.current_resource_name = resource_name
@@ -70,56 +211,99 @@ class FormGenerator(QWidget):
         self.title_label.setText(f"Edit {resource_type}: {resource_name}")
         
         # Generate form fields
+        self.model.setRowCount(0)
+        self.form_fields = {}
         self.generate_form_fields(config)
+        self.tree_view.expandAll()
+        
+        self.empty_label.setVisible(False)
+        self.tree_view.setVisible(True)
         
         # Show apply button
         self.apply_button.setVisible(True)
     
     def clear_form(self):
-        """Clear the form layout."""
-        # Remove all widgets from the form layout
-        while self.form_layout.count() > 0:
-            item = self.form_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Reset fields dictionary
+        """Show the empty state instead of a resource form."""
+        self.model.setRowCount(0)
         self.form_fields = {}
+        self.current_resource_type = None
+        self.current_resource_name = None
+        self.title_label.setText("Resource Properties")
+        
+        self.tree_view.setVisible(False)
+        self.empty_label.setVisible(True)
+    
+    def on_resource_removed(self, resource_type, resource_name):
+        """
+        Clear the form if the resource being edited was removed.
+        
+        Args:
+            resource_type: Type of the removed resource
+            resource_name: Name of the removed resource
+        """
+        if (resource_type, resource_name) == (self.current_resource_type, self.current_resource_name):
+            self.clear_form()
     
     def generate_form_fields(self, config, prefix=""):
         """
         Generate form fields for the configuration.
         
+        Nested dictionaries of any depth become group rows. They are walked
+        with an explicit stack of iterators, depth first, so fields keep
+        their configuration order.
+        
         Args:
             config: Configuration dictionary
             prefix: Prefix for nested fields
         """
-        for key, value in config.items():
-            field_name = f"{prefix}{key}" if prefix else key
+        stack = [(self.model.invisibleRootItem(), iter(config.items()), prefix)]
+        
+        while stack:
+            parent_item, items, prefix = stack[-1]
+            entry = next(items, None)
+            if entry is None:
+                stack.pop()
+                continue
+            
+            key, value = entry
+            field_name = f"{prefix}{key}"
+            label = key.replace("_", " ").title()
             
             if isinstance(value, dict):
-                # Create a group box for nested fields
-                group_box = QGroupBox(key.replace("_", " ").title())
-                group_layout = QFormLayout(group_box)
+                # Create a group row for nested fields
+                group_item = QStandardItem(label)
+                group_item.setEditable(False)
+                group_value = QStandardItem()
+                group_value.setEditable(False)
+                parent_item.appendRow([group_item, group_value])
                 
-                self.form_layout.addWidget(group_box)
-                
-                # Recursively generate nested fields
-                nested_prefix = f"{field_name}."
-                for nested_key, nested_value in value.items():
-                    nested_field_name = f"{nested_prefix}{nested_key}"
-                    
-                    # Create field for nested value
-                    field_widget = self.create_field_widget(nested_key, nested_value)
-                    if field_widget:
-                        group_layout.addRow(nested_key.replace("_", " ").title(), field_widget)
-                        self.form_fields[nested_field_name] = field_widget
+                stack.append((group_item, iter(value.items()), f"{field_name}."))
             else:
                 # Create field for the value
-                field_widget = self.create_field_widget(key, value)
-                if field_widget:
-                    self.form_layout.addRow(key.replace("_", " ").title(), field_widget)
-                    self.form_fields[field_name] = field_widget
+                self.form_fields[field_name] = self._append_field(parent_item, key, label, value)
+    
+    def _append_field(self, parent_item, key, label, value):
+        """
+        Append a field row under a parent item.
+        
+        Args:
+            parent_item: Item the row is added to
+            key: Field key
+            label: Field label
+            value: Field value
+            
+        Returns:
+            QStandardItem holding the value
+        """
+        label_item = QStandardItem(label)
+        label_item.setEditable(False)
+        
+        value_item = QStandardItem()
+        value_item.setData(value if isinstance(value, _MODEL_VALUE_TYPES) else str(value), Qt.EditRole)
+        value_item.setData(key, FIELD_KEY_ROLE)
+        
+        parent_item.appendRow([label_item, value_item])
+        return value_item
     
     def create_field_widget(self, key, value):
         """
@@ -132,109 +316,24 @@ class FormGenerator(QWidget):
         Returns:
             QWidget for editing the field
         """
-        if isinstance(value, bool):
-            # Checkbox for boolean values
-            widget = QCheckBox()
-            widget.setChecked(value)
-            return widget
-        elif isinstance(value, int):
-            # Spin box for integer values
-            widget = QSpinBox()
-            widget.setRange(-2147483648, 2147483647)
-            widget.setValue(value)
-            return widget
-        elif isinstance(value, float):
-            # Double spin box for float values
-            widget = QDoubleSpinBox()
-            widget.setRange(-2147483648, 2147483647)
-            widget.setValue(value)
-            return widget
-        elif isinstance(value, str):
-            # Special handling for common fields
-            if key.endswith("_type") or key in ["tier", "size", "type"]:
-                # Combo box for type selections
-                widget = QComboBox()
-                
-                # Add common options based on the key
-                if key == "instance_type":
-                    widget.addItems(["t2.micro", "t2.small", "t2.medium", "t3.micro", "t3.small", "t3.medium"])
-                elif key == "account_tier":
-                    widget.addItems(["Standard", "Premium"])
-                elif key == "account_replication_type":
-                    widget.addItems(["LRS", "GRS", "RAGRS", "ZRS", "GZRS", "RAGZRS"])
-                else:
-                    # Generic combo with current value
-                    widget.addItem(value)
-                
-                # Set current value
-                index = widget.findText(value)
-                if index >= 0:
-                    widget.setCurrentIndex(index)
-                    
-                return widget
-            elif key in ["region", "location"]:
-                # Combo box for regions/locations
-                widget = QComboBox()
-                
-                if key == "region":
-                    # AWS regions
-                    widget.addItems([
-                        "us-east-1", "us-east-2", "us-west-1", "us-west-2",
-                        "eu-west-1", "eu-west-2", "eu-central-1",
-                        "ap-northeast-1", "ap-northeast-2", "ap-southeast-1", "ap-southeast-2"
-                    ])
-                else:
-                    # Azure locations
-                    widget.addItems([
-                        "East US", "East US 2", "Central US", "West US", "West US 2",
-                        "North Europe", "West Europe", "UK South", "UK West",
-                        "East Asia", "Southeast Asia", "Australia East"
-                    ])
-                
-                # Set current value
-                index = widget.findText(value)
-                if index >= 0:
-                    widget.setCurrentIndex(index)
-                    
-                return widget
-            else:
-                # Line edit for string values
-                widget = QLineEdit(value)
-                return widget
-        else:
-            # Default to line edit for other types
-            widget = QLineEdit(str(value))
-            return widget
+        return _TYPE_DISPATCH.get(type(value), _make_line_edit)(key, value)
     
     def apply_changes(self):
         """Apply changes from the form to the resource."""
-        if not hasattr(self.parent(), "canvas") or not self.current_resource_type:
+        if not self.current_resource_type:
             return
         
-        # Find the resource in the canvas
-        for resource in self.parent().canvas.resources:
-            if (resource.resource_type == self.current_resource_type and 
-                resource.resource_name == self.current_resource_name):
-                
-                # Update the resource configuration
-                updated_config = {}
-                
-                for field_name, widget in self.form_fields.items():
-                    # Handle nested fields
-                    if "." in field_name:
-                        parts = field_name.split(".")
-                        parent_key = parts[0]
-                        child_key = parts[1]
-                        
-                        if parent_key not in updated_config:
-                            updated_config[parent_key] = {}
-                        
-                        updated_config[parent_key][child_key] = self.get_widget_value(widget)
-                    else:
-                        updated_config[field_name] = self.get_widget_value(widget)
-                
-                resource.config = updated_config
-                break
+        # Rebuild the configuration from the model, nesting dotted fields
+        updated_config = {}
+        
+        for field_name, item in self.form_fields.items():
+            *parent_keys, key = field_name.split(".")
+            target = updated_config
+            for parent_key in parent_keys:
+                target = target.setdefault(parent_key, {})
+            target[key] = item.data(Qt.EditRole)
+        
+        self.resource_updated.emit(self.current_resource_type, self.current_resource_name, updated_config)
     
     def get_widget_value(self, widget):
         """
@@ -255,4 +354,26 @@ class FormGenerator(QWidget):
         elif isinstance(widget, QLineEdit):
             return widget.text()
         else:
-            return None
\ No newline at end of file
+            return None
+    
+    def set_widget_value(self, widget, value):
+        """
+        Set the value shown by a form widget.
+        
+        Args:
+            widget: Form field widget
+            value: Value to show
+        """
+        if isinstance(widget, QCheckBox):
+            widget.setChecked(value)
+        elif isinstance(widget, QSpinBox) or isinstance(widget, QDoubleSpinBox):
+            widget.setValue(value)
+        elif isinstance(widget, QComboBox):
+            index = widget.findText(value)
+            if index < 0:
+                # Generic combos only list the value they were built with
+                widget.addItem(value)
+                index = widget.count() - 1
+            widget.setCurrentIndex(index)
+        elif isinstance(widget, QLineEdit):
+            widget.setText(value if isinstance(value, str) else str(value))
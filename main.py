@@ -26,24 +26,33 @@ Main entry point for the TerraScope application.
 """
 import sys
 from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
 import os
 
 from gui.app_window import AppWindow
 from core import initialize_app
 
+# Application icon next to this file, checked once at import
+ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "icon.png")
+HAS_ICON = os.path.isfile(ICON_PATH)
+
 def main():
     """Main entry point for the application."""
     # Initialize the core application
     initialize_app()
     
+    # High DPI attributes only take effect before the application exists
+    QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+    QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+    
     # Create the Qt application
     app = QApplication(sys.argv)
     app.setApplicationName("TerraScope")
     
     # Set application icon if available
-    if os.path.exists("resources/icon.png"):
-        app.setWindowIcon(QIcon("resources/icon.png"))
+    if HAS_ICON:
+        app.setWindowIcon(QIcon(ICON_PATH))
     
     # Create and show the main window
     window = AppWindow()
@@ -0,0 +1,34 @@
+"""
+Shared pytest setup for the TerraScope test suite
+Runs once per session, before any test module is imported
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+# Setup necessary directories before importing core modules
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+output_dir = os.path.join(project_root, "output")
+os.makedirs(output_dir, exist_ok=True)
+
+# Make the core package importable
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+
+def pytest_configure(config):
+    """Keep ResourceManager's cache out of the user's cache directory"""
+    config._terrascope_cache_dir = tempfile.mkdtemp(prefix="terrascope-cache-")
+    config._terrascope_cache_env = os.environ.get("TERRASCOPE_CACHE_DIR")
+    os.environ["TERRASCOPE_CACHE_DIR"] = config._terrascope_cache_dir
+
+
+def pytest_unconfigure(config):
+    """Restore the cache setting and remove the session's cache directory"""
+    if config._terrascope_cache_env is None:
+        os.environ.pop("TERRASCOPE_CACHE_DIR", None)
+    else:
+        os.environ["TERRASCOPE_CACHE_DIR"] = config._terrascope_cache_env
+    shutil.rmtree(config._terrascope_cache_dir, ignore_errors=True)
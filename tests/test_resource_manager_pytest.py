@@ -4,90 +4,136 @@ Run with: pytest test_resource_manager_pytest.py -v
 """
 
 import pytest
+import copy
 import json
 import os
-import tempfile
+from functools import cache, lru_cache
 from pathlib import Path
 
-# Setup necessary directories before importing core modules
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-output_dir = os.path.join(project_root, "output")
-os.makedirs(output_dir, exist_ok=True)
-
-# Import the ResourceManager
-import sys
-sys.path.insert(0, project_root)
+# Import the ResourceManager (tests/conftest.py puts the project root on sys.path)
 from core.resource_manager import ResourceManager
 
+try:
+    import orjson # Optional, serializes the test data faster
+except ImportError:
+    orjson = None
 
-@pytest.fixture
-def resources_json():
-    """Fixture that provides the actual resources.json content"""
-    return {
-        "aws_s3_bucket": {
-            "provider": "aws",
-            "defaults": {
-                "bucket": "my-terraform-bucket",
-                "acl": "private",
-                "tags": {
-                    "Environment": "Dev",
-                    "CreatedBy": "Terrascope"
-                }
-            },
-            "required_fields": ["bucket"],
-            "popular": True,
-            "description": "AWS S3 Bucket for object storage"
+# Fields every resource template has, and their types
+_RESOURCE_FIELDS = {
+    "provider": str,
+    "defaults": dict,
+    "required_fields": list,
+    "popular": bool,
+    "description": str,
+}
+
+
+def _check_resource_schema(resource):
+    """Assert a resource template has every field with the expected type"""
+    wrong = [field for field, field_type in _RESOURCE_FIELDS.items()
+             if not isinstance(resource.get(field), field_type)]
+    assert not wrong, f"missing or mistyped fields: {wrong}"
+
+
+def _dumps(obj):
+    """Serialize test data to JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+# Test data mirroring resources.json, built once at import (do not mutate)
+_RESOURCES_JSON = {
+    "aws_s3_bucket": {
+        "provider": "aws",
+        "defaults": {
+            "bucket": "my-terraform-bucket",
+            "acl": "private",
+            "tags": {
+                "Environment": "Dev",
+                "CreatedBy": "Terrascope"
+            }
         },
-        "aws_instance": {
-            "provider": "aws",
-            "defaults": {
-                "ami": "ami-0c55b159cbfafe1f0",
-                "instance_type": "t2.micro",
-                "tags": {
-                    "Name": "TerrascopeInstance",
-                    "Environment": "Dev"
-                }
-            },
-            "required_fields": ["ami", "instance_type"],
-            "popular": True,
-            "description": "AWS EC2 Instance"
+        "required_fields": ["bucket"],
+        "popular": True,
+        "description": "AWS S3 Bucket for object storage"
+    },
+    "aws_instance": {
+        "provider": "aws",
+        "defaults": {
+            "ami": "ami-0c55b159cbfafe1f0",
+            "instance_type": "t2.micro",
+            "tags": {
+                "Name": "TerrascopeInstance",
+                "Environment": "Dev"
+            }
         },
-        "azurerm_resource_group": {
-            "provider": "azurerm",
-            "defaults": {
-                "name": "terrascope-resources",
-                "location": "East US",
-                "tags": {
-                    "environment": "dev"
-                }
-            },
-            "required_fields": ["name", "location"],
-            "popular": True,
-            "description": "Azure Resource Group"
-        }
+        "required_fields": ["ami", "instance_type"],
+        "popular": True,
+        "description": "AWS EC2 Instance"
+    },
+    "azurerm_resource_group": {
+        "provider": "azurerm",
+        "defaults": {
+            "name": "terrascope-resources",
+            "location": "East US",
+            "tags": {
+                "environment": "dev"
+            }
+        },
+        "required_fields": ["name", "location"],
+        "popular": True,
+        "description": "Azure Resource Group"
     }
+}
+
+# The test data serialized once, so fixtures only write bytes
+_RESOURCES_JSON_BYTES = _dumps(_RESOURCES_JSON)
+
+# Expected required fields, order-insensitive
+_EC2_REQUIRED = frozenset({"ami", "instance_type"})
+_RG_REQUIRED = frozenset({"name", "location"})
+
+# Expected resource types and providers of the test data
+_AWS_TYPES = frozenset({"aws_s3_bucket", "aws_instance"})
+_AZURE_TYPES = frozenset({"azurerm_resource_group"})
+_ALL_TYPES = _AWS_TYPES | _AZURE_TYPES
+_EXPECTED_PROVIDERS = frozenset({"aws", "azurerm"})
 
-# unit tests follow the AAA pattern
 
 @pytest.fixture
-def temp_resources_file(resources_json):
-    """Create a temporary resources.json file for testing"""
-    # Arrange: Create a temporary file with the JSON content
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(resources_json, f)
-        temp_path = f.name
-    
-    yield temp_path
-    
-    # Cleanup
-    os.unlink(temp_path)
+def mutable_resources_json():
+    """Fixture that provides a private copy of the test data for tests that modify it"""
+    return copy.deepcopy(_RESOURCES_JSON)
+
+# unit tests follow the AAA pattern
+
+@pytest.fixture(scope="session")
+def _rm_singleton():
+    """Load the test data into a ResourceManager once per session"""
+    # Hand the templates over directly; file loading has its own tests below
+    return ResourceManager(resources=copy.deepcopy(_RESOURCES_JSON))
+
+
+@pytest.fixture(scope="session")
+def empty_resource_manager(tmp_path_factory):
+    """Create a ResourceManager from an empty JSON file once per session"""
+    path = tmp_path_factory.mktemp("rm_empty") / "empty.json"
+    path.write_bytes(b"{}")
+    return ResourceManager(resources_path=str(path))
 
 
 @pytest.fixture
-def resource_manager(temp_resources_file):
+def resource_manager(_rm_singleton):
     """Create a ResourceManager instance with test data"""
-    # Act: Initialize ResourceManager with the temporary file
-    return ResourceManager(resources_path=temp_resources_file)
+    # Act: Copy the loaded manager instead of parsing the file again; a deep
+    # copy keeps the indexes pointing at the copied resources
+    rm = copy.deepcopy(_rm_singleton)
+    
+    # Templates are fetched repeatedly within a test; memoize them on the
+    # copy (deepcopy would share a cache wrapped around the singleton)
+    rm.get_resource_template = lru_cache(maxsize=None)(rm.get_resource_template)
+    return rm
 
 
 class TestResourceManager:
@@ -102,10 +148,9 @@ class TestResourceManager:
     # Test loading resources from JSON file
     def test_load_resources(self, resource_manager):
         """Test loading resources from JSON file"""
+        missing = _ALL_TYPES - resource_manager.resources.keys() # Check if specific resources are loaded
+        assert not missing, f"missing={missing}"
         assert len(resource_manager.resources) == 3 # Check if the correct number of resources are loaded
-        assert "aws_s3_bucket" in resource_manager.resources # Check if specific resources are loaded
-        assert "aws_instance" in resource_manager.resources # Check if specific resources are loaded
-        assert "azurerm_resource_group" in resource_manager.resources
     
     # Test getting specific resource templates
     def test_get_resource_template(self, resource_manager):
@@ -125,27 +170,32 @@ class TestResourceManager:
         """Test filtering resources by provider"""
         # Test AWS resources
         aws_resources = resource_manager.get_resources_by_provider("aws")
-        assert len(aws_resources) == 2
-        assert "aws_s3_bucket" in aws_resources
-        assert "aws_instance" in aws_resources
-        assert "azurerm_resource_group" not in aws_resources
+        assert aws_resources.keys() == _AWS_TYPES
         
         # Test Azure resources
         azure_resources = resource_manager.get_resources_by_provider("azurerm")
-        assert len(azure_resources) == 1
-        assert "azurerm_resource_group" in azure_resources
-        assert "aws_s3_bucket" not in azure_resources
+        assert azure_resources.keys() == _AZURE_TYPES
         
         # Test non-existent provider
         fake_resources = resource_manager.get_resources_by_provider("fake_provider")
         assert len(fake_resources) == 0
     
+    def test_get_all_resources_grouped(self, resource_manager):
+        """Test all resource types grouped by provider"""
+        grouped = resource_manager.get_all_resources_grouped()
+        assert grouped == {
+            "aws": ["aws_s3_bucket", "aws_instance"],
+            "azurerm": ["azurerm_resource_group"]
+        }
+        
+        # Built once per load, not per call
+        assert resource_manager.get_all_resources_grouped() is grouped
+    
     def test_get_resource_groups(self, resource_manager):
         """Test getting available resource groups/providers"""
         groups = resource_manager.get_resource_groups()
         assert len(groups) == 2
-        assert "aws" in groups
-        assert "azurerm" in groups
+        assert frozenset(groups) == _EXPECTED_PROVIDERS
     
     def test_get_popular_resources(self, resource_manager):
         """Test getting popular resources"""
@@ -157,22 +207,21 @@ class TestResourceManager:
         popular_limited = resource_manager.get_popular_resources(limit=2)
         assert len(popular_limited) == 2
     
-    def test_resource_structure(self, resource_manager):
+    def test_get_popular_resources_by_score(self, mutable_resources_json, tmp_path):
+        """Test popularity_score ranks popular resources and ties keep file order"""
+        resources_json = mutable_resources_json
+        resources_json["azurerm_resource_group"]["popularity_score"] = 5
+        path = tmp_path / "resources.json"
+        path.write_bytes(_dumps(resources_json))
+        
+        rm = ResourceManager(resources_path=str(path))
+        assert rm.get_popular_resources() == ["azurerm_resource_group", "aws_s3_bucket", "aws_instance"]
+    
+    @pytest.mark.parametrize("resource_type", ["aws_s3_bucket", "aws_instance", "azurerm_resource_group"])
+    def test_resource_structure(self, resource_manager, resource_type):
         """Test the structure of loaded resources"""
-        for resource_type, resource in resource_manager.resources.items():
-            # Every resource should have these fields
-            assert "provider" in resource
-            assert "defaults" in resource
-            assert "required_fields" in resource
-            assert "popular" in resource
-            assert "description" in resource
-            
-            # Test types
-            assert isinstance(resource["provider"], str)
-            assert isinstance(resource["defaults"], dict)
-            assert isinstance(resource["required_fields"], list)
-            assert isinstance(resource["popular"], bool)
-            assert isinstance(resource["description"], str)
+        # Every resource should have these fields, with these types
+        _check_resource_schema(resource_manager.resources[resource_type])
     
     def test_required_fields(self, resource_manager):
         """Test required fields are properly loaded"""
@@ -180,10 +229,10 @@ class TestResourceManager:
         assert s3_template["required_fields"] == ["bucket"]
         
         ec2_template = resource_manager.get_resource_template("aws_instance")
-        assert set(ec2_template["required_fields"]) == {"ami", "instance_type"}
+        assert frozenset(ec2_template["required_fields"]) == _EC2_REQUIRED
         
         rg_template = resource_manager.get_resource_template("azurerm_resource_group")
-        assert set(rg_template["required_fields"]) == {"name", "location"}
+        assert frozenset(rg_template["required_fields"]) == _RG_REQUIRED
     
     def test_resource_defaults(self, resource_manager):
         """Test default values are properly loaded"""
@@ -195,57 +244,121 @@ class TestResourceManager:
         assert defaults["tags"]["Environment"] == "Dev"
     
     
-    def test_empty_json(self):
+    def test_empty_json(self, empty_resource_manager):
         """Test behavior with empty JSON file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump({}, f)
-            temp_path = f.name
+        rm = empty_resource_manager
+        assert len(rm.resources) == 0
+        assert rm.get_resource_template("any_resource") is None
+        assert len(rm.get_resources_by_provider("any_provider")) == 0
+        assert len(rm.get_resource_groups()) == 0
+        assert len(rm.get_popular_resources()) == 0
+    
+    def test_load_from_file(self, resource_manager, tmp_path):
+        """Test templates parsed from a file match the injected ones"""
+        path = tmp_path / "resources.json"
+        path.write_bytes(_RESOURCES_JSON_BYTES)
+        rm = ResourceManager(resources_path=str(path))
+        assert rm.resources == resource_manager.resources
+        assert rm.get_all_resources_grouped() == resource_manager.get_all_resources_grouped()
+    
+    def test_load_without_orjson(self, resource_manager, tmp_path, monkeypatch):
+        """Test the stdlib json fallback parses the same resources as orjson"""
+        monkeypatch.setattr("core.resource_manager.orjson", None)
+        path = tmp_path / "resources.json"
+        path.write_bytes(_RESOURCES_JSON_BYTES)
+        rm = ResourceManager(resources_path=str(path))
+        assert rm.resources == resource_manager.resources
+    
+    def test_resource_cache(self, tmp_path):
+        """Test the parsed resources are cached and refreshed when the file changes"""
+        path = tmp_path / "resources.json"
+        path.write_bytes(_RESOURCES_JSON_BYTES)
+        cache_dir = tmp_path / "cache"
+        rm = ResourceManager(resources_path=str(path), cache_dir=str(cache_dir))
+        assert os.path.dirname(rm.cache_path) == str(cache_dir)
+        assert os.path.exists(rm.cache_path)
         
-        try:
-            rm = ResourceManager(resources_path=temp_path)
-            assert len(rm.resources) == 0
-            assert rm.get_resource_template("any_resource") is None
-            assert len(rm.get_resources_by_provider("any_provider")) == 0
-            assert len(rm.get_resource_groups()) == 0
-            assert len(rm.get_popular_resources()) == 0
-        finally:
-            os.unlink(temp_path)
-
-
-@pytest.mark.parametrize("resource_type,expected_provider", [
-    ("aws_s3_bucket", "aws"),
-    ("aws_instance", "aws"),
-    ("azurerm_resource_group", "azurerm"),
-])
-def test_resource_provider_mapping(resource_manager, resource_type, expected_provider):
-    """Parametrized test for resource-provider mapping"""
-    resource = resource_manager.get_resource_template(resource_type)
-    assert resource["provider"] == expected_provider
-
-
-@pytest.mark.parametrize("provider,expected_count", [
-    ("aws", 2),
-    ("azurerm", 1),
-    ("gcp", 0),
-])
-def test_provider_resource_count(resource_manager, provider, expected_count):
-    """Parametrized test for resource counts by provider"""
-    resources = resource_manager.get_resources_by_provider(provider)
-    assert len(resources) == expected_count
+        # Warm start reads the same resources back from the cache
+        cached = ResourceManager(resources_path=str(path), cache_dir=str(cache_dir))
+        assert cached.resources == rm.resources
+        
+        # Changing the source file invalidates the cache
+        path.write_bytes(_dumps({"aws_vpc": rm.resources["aws_s3_bucket"]}))
+        reloaded = ResourceManager(resources_path=str(path), cache_dir=str(cache_dir))
+        assert list(reloaded.resources) == ["aws_vpc"]
+    
+    def test_resource_cache_disabled(self, tmp_path):
+        """Test use_cache=False neither reads nor writes the cache"""
+        path = tmp_path / "resources.json"
+        path.write_bytes(_RESOURCES_JSON_BYTES)
+        rm = ResourceManager(resources_path=str(path), cache_dir=str(tmp_path / "cache"), use_cache=False)
+        assert rm.resources == _RESOURCES_JSON
+        assert not os.path.exists(rm.cache_path)
+    
+    def test_resource_cache_unwritable(self, tmp_path, caplog):
+        """Test a cache directory that cannot be created is logged, not printed"""
+        path = tmp_path / "resources.json"
+        path.write_bytes(_RESOURCES_JSON_BYTES)
+        blocker = tmp_path / "not_a_dir"
+        blocker.write_bytes(b"")
+        rm = ResourceManager(resources_path=str(path), cache_dir=str(blocker / "cache"))
+        assert rm.resources == _RESOURCES_JSON
+        assert "Could not write resource cache" in caplog.text
+
+
+def test_provider_mappings(resource_manager):
+    """Test resource-provider mapping and resource counts by provider"""
+    expected_providers = [
+        ("aws_s3_bucket", "aws"),
+        ("aws_instance", "aws"),
+        ("azurerm_resource_group", "azurerm"),
+    ]
+    wrong = [(rt, provider) for rt, provider in expected_providers
+             if resource_manager.get_resource_template(rt)["provider"] != provider]
+    assert not wrong, f"wrong providers: {wrong}"
+    
+    expected_counts = [("aws", 2), ("azurerm", 1), ("gcp", 0)]
+    counts = [(provider, len(resource_manager.get_resources_by_provider(provider)))
+              for provider, _ in expected_counts]
+    assert counts == expected_counts
+
+
+# The full resources file (ResourceManager's default path)
+_FULL_RESOURCES_PATH = "data/resources.json"
+
+
+@cache
+def _integration_data_available():
+    """Whether the full resources file exists, checked once per session"""
+    return os.path.exists(_FULL_RESOURCES_PATH)
+
+
+@pytest.fixture(scope="session")
+def full_resource_manager():
+    """Create ResourceManager with the actual resources.json file once per session"""
+    if not _integration_data_available():
+        pytest.skip(f"{_FULL_RESOURCES_PATH} not found")
+    return ResourceManager()
+
+
+def _full_resource_types():
+    """Resource types in data/resources.json, read at collection time"""
+    if not _integration_data_available():
+        return []
+    # Runs before any fixture, so don't leave a cache behind
+    return list(ResourceManager(use_cache=False).resources)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize full-file tests with one case per resource type"""
+    if "full_resource_type" in metafunc.fixturenames:
+        metafunc.parametrize("full_resource_type", _full_resource_types())
 
 
 # Integration tests
 class TestResourceManagerIntegration:
     """Integration tests using the full resources.json file"""
     
-    @pytest.fixture
-    def full_resource_manager(self):
-        """Create ResourceManager with the actual resources.json file"""
-        # Assuming the actual resources.json exists in data/resources.json
-        if not os.path.exists("data/resources.json"):
-            pytest.skip("data/resources.json not found")
-        return ResourceManager()
-    
     def test_aws_resource_count(self, full_resource_manager):
         """Test the number of AWS resources in the full file"""
         aws_resources = full_resource_manager.get_resources_by_provider("aws")
@@ -256,21 +369,15 @@ class TestResourceManagerIntegration:
         azure_resources = full_resource_manager.get_resources_by_provider("azurerm")
         assert len(azure_resources) >= 10  # Based on your provided JSON
     
-    def test_all_resources_have_required_structure(self, full_resource_manager):
+    def test_all_resources_have_required_structure(self, full_resource_manager, full_resource_type):
         """Test that all resources have the required structure"""
-        for resource_type, resource in full_resource_manager.resources.items():
-            assert "provider" in resource, f"{resource_type} missing provider"
-            assert "defaults" in resource, f"{resource_type} missing defaults"
-            assert "required_fields" in resource, f"{resource_type} missing required_fields"
-            assert "popular" in resource, f"{resource_type} missing popular"
-            assert "description" in resource, f"{resource_type} missing description"
+        _check_resource_schema(full_resource_manager.resources[full_resource_type])
     
     def test_popular_resources_mix(self, full_resource_manager):
         """Test that popular resources include both AWS and Azure"""
         popular = full_resource_manager.get_popular_resources()
         providers = {full_resource_manager.resources[r]["provider"] for r in popular}
-        assert "aws" in providers
-        assert "azurerm" in providers
+        assert _EXPECTED_PROVIDERS <= providers
 
 
 if __name__ == "__main__":
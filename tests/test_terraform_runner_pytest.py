@@ -0,0 +1,65 @@
+"""
+Automated test suite for TerraformRunner using pytest
+Run with: pytest test_terraform_runner_pytest.py -v
+"""
+
+import pytest
+import os
+
+# Import the TerraformRunner (tests/conftest.py puts the project root on sys.path)
+from core.terraform_runner import TerraformRunner
+
+
+@pytest.fixture
+def runner(tmp_path):
+    """Create a TerraformRunner working in a temporary directory"""
+    return TerraformRunner(working_dir=str(tmp_path), parallelism=4)
+
+
+class TestTerraformRunner:
+    """Test suite for TerraformRunner"""
+
+    def test_default_parallelism(self, tmp_path):
+        """Test parallelism defaults to three times the CPU count"""
+        runner = TerraformRunner(working_dir=str(tmp_path))
+        assert runner.parallelism == (os.cpu_count() or 1) * 3
+
+    def test_command_args(self, runner):
+        """Test plan/apply/destroy pass parallelism and auto-approve"""
+        assert runner.init_args() == ["init", "-no-color"]
+        assert runner.plan_args() == ["plan", "-no-color", "-parallelism=4"]
+        assert runner.apply_args(auto_approve=True) == ["apply", "-no-color", "-parallelism=4", "-auto-approve"]
+        assert runner.destroy_args() == ["destroy", "-no-color", "-parallelism=4"]
+
+    def test_refresh_disabled(self, tmp_path):
+        """Test refresh=False adds -refresh=false except when applying a saved plan"""
+        runner = TerraformRunner(working_dir=str(tmp_path), parallelism=4, refresh=False)
+        assert runner.plan_args(out_file="tfplan") == [
+            "plan", "-no-color", "-parallelism=4", "-refresh=false", "-out=tfplan"
+        ]
+        assert runner.apply_args(plan_file="tfplan") == ["apply", "-no-color", "-parallelism=4", "tfplan"]
+
+    def test_env_inherited(self, tmp_path, monkeypatch):
+        """Test terraform gets the whole environment, copied when the runner is built"""
+        monkeypatch.setenv("TF_LOG", "DEBUG")
+        monkeypatch.setenv("SSH_AUTH_SOCK", "/tmp/agent.sock")
+        monkeypatch.setenv("IDENTITY_ENDPOINT", "http://localhost:42356/msi/token")
+
+        runner = TerraformRunner(working_dir=str(tmp_path))
+        assert runner.env == dict(os.environ)
+
+        monkeypatch.setenv("TF_LOG", "TRACE")
+        assert runner.env["TF_LOG"] == "DEBUG"
+
+    def test_missing_terraform(self, runner, monkeypatch):
+        """Test a missing terraform binary is reported instead of raised"""
+        monkeypatch.setitem(runner.env, "PATH", "")
+        code, stdout, stderr = runner.run_command(["version"])
+        assert code == 1
+        assert stdout == ""
+        assert stderr
+
+
+if __name__ == "__main__":
+    # Run with pytest
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,190 @@
+"""
+Automated test suite for TerraformWriter using pytest
+Run with: pytest test_terraform_writer_pytest.py -v
+"""
+
+import pytest
+import sys
+
+# Import the TerraformWriter (tests/conftest.py puts the project root on sys.path)
+from core.terraform_writer import TerraformWriter
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Create a TerraformWriter that writes into a temporary directory"""
+    return TerraformWriter(output_dir=str(tmp_path))
+
+
+class TestTerraformWriter:
+    """Test suite for TerraformWriter"""
+
+    def test_terraform_block(self, writer):
+        """Test the terraform block with and without a backend"""
+        assert writer.create_terraform_block() == 'terraform {\n  required_version = ">= 1.0.0"\n}\n'
+
+        block = writer.create_terraform_block("s3", {"bucket": "state", "encrypt": True, "retries": 3})
+        assert block == (
+            'terraform {\n'
+            '  required_version = ">= 1.0.0"\n'
+            '  backend "s3" {\n'
+            '    bucket = "state"\n'
+            '    encrypt = true\n'
+            '    retries = 3\n'
+            '  }\n'
+            '}\n'
+        )
+
+    def test_provider_block(self, writer):
+        """Test provider blocks format strings, booleans and other values"""
+        block = writer.create_provider_block("aws", {"region": "us-west-2", "skip": False, "retries": 3})
+        assert block == (
+            'provider "aws" {\n'
+            '  region = "us-west-2"\n'
+            '  skip = false\n'
+            '  retries = 3\n'
+            '}\n'
+        )
+
+    def test_resource_block_name_sanitized(self, writer):
+        """Test resource names are turned into valid HCL identifiers"""
+        block = writer.create_resource_block("aws_s3_bucket", "My-Bucket name", {})
+        assert block == 'resource "aws_s3_bucket" "my_bucket_name" {\n}\n'
+
+    def test_resource_block_nested(self, writer):
+        """Test nested maps, blocks, lists and references"""
+        config = {
+            "tags": {"Name": "web"},
+            "ingress": [{"from_port": 22, "cidr_blocks": ["0.0.0.0/0"]}, {"from_port": 80}],
+            "empty": [],
+            "flags": [True, 1, "a"],
+            "vpc_id": "var.vpc_id",
+            "enabled": True,
+            "ratio": 1.5,
+        }
+        block = writer.create_resource_block("aws_security_group", "web", config)
+        assert block == (
+            'resource "aws_security_group" "web" {\n'
+            '  tags {\n'
+            '    Name = "web"\n'
+            '  }\n'
+            '  ingress {\n'
+            '    from_port = 22\n'
+            '    cidr_blocks = ["0.0.0.0/0"]\n'
+            '  }\n'
+            '  ingress {\n'
+            '    from_port = 80\n'
+            '  }\n'
+            '  empty = []\n'
+            '  flags = [true, 1, "a"]\n'
+            '  vpc_id = var.vpc_id\n'
+            '  enabled = true\n'
+            '  ratio = 1.5\n'
+            '}\n'
+        )
+
+    def test_resource_block_deep_nesting(self, writer):
+        """Test nesting deeper than the recursion limit is formatted"""
+        depth = sys.getrecursionlimit() + 100
+        config = value = {}
+        for _ in range(depth):
+            value["n"] = {}
+            value = value["n"]
+
+        block = writer.create_resource_block("null_resource", "deep", config)
+        assert block.count("n {") == depth
+        assert block.endswith("  }\n}\n")
+
+    def test_resource_block_cache(self, writer):
+        """Test identical inputs reuse the rendered block and changed configs don't"""
+        first = writer.create_resource_block("aws_instance", "web", {"ami": "ami-123"})
+        assert writer.create_resource_block("aws_instance", "web", {"ami": "ami-123"}) is first
+
+        changed = writer.create_resource_block("aws_instance", "web", {"ami": "ami-456"})
+        assert changed == 'resource "aws_instance" "web" {\n  ami = "ami-456"\n}\n'
+
+    def test_generate_main_tf(self, writer, tmp_path):
+        """Test main.tf contains provider blocks followed by resource blocks"""
+        resources = [{"type": "aws_instance", "name": "web", "config": {"ami": "ami-123"}}]
+        assert writer.generate_main_tf(resources, {"aws": {"region": "us-west-2"}})
+
+        content = (tmp_path / "main.tf").read_text()
+        assert content == (
+            'provider "aws" {\n'
+            '  region = "us-west-2"\n'
+            '}\n'
+            '\n'
+            'resource "aws_instance" "web" {\n'
+            '  ami = "ami-123"\n'
+            '}\n'
+            '\n'
+        )
+
+    def test_render_main_tf_matches_file(self, writer, tmp_path):
+        """Test render_main_tf returns exactly what generate_main_tf writes"""
+        resources = [{"type": "azurerm_resource_group", "name": "rg", "config": {"location": "East US"}}]
+        providers = {"azurerm": {"features": {}}}
+        assert writer.generate_main_tf(resources, providers)
+        assert (tmp_path / "main.tf").read_text() == writer.render_main_tf(resources, providers)
+
+    def test_generate_main_tf_failure_keeps_old_file(self, writer, tmp_path):
+        """Test a failed render leaves the previous main.tf in place"""
+        resources = [{"type": "aws_instance", "name": "web", "config": {"ami": "ami-123"}}]
+        assert writer.generate_main_tf(resources)
+        previous = (tmp_path / "main.tf").read_text()
+
+        broken = resources + [{"type": "aws_s3_bucket", "name": "logs"}]
+        assert not writer.generate_main_tf(broken)
+        assert (tmp_path / "main.tf").read_text() == previous
+        assert [p.name for p in tmp_path.iterdir()] == ["main.tf"]
+
+    def test_generate_split_tf(self, writer, tmp_path):
+        """Test resources are split into one file per provider and main.tf is replaced"""
+        resources = [
+            {"type": "aws_instance", "name": "web", "config": {"ami": "ami-123"}},
+            {"type": "azurerm_resource_group", "name": "rg", "config": {"location": "East US"}},
+        ]
+        providers = {"aws": {"region": "us-west-2"}, "azurerm": {"features": {}}}
+        assert writer.generate_main_tf(resources, providers)
+
+        assert writer.generate_split_tf(resources, providers)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".terrascope-split", "aws.tf", "azurerm.tf", "providers.tf"]
+        assert (tmp_path / "aws.tf").read_text() == writer.create_resource_block("aws_instance", "web", {"ami": "ami-123"}) + "\n"
+        assert (tmp_path / "providers.tf").read_text().startswith('provider "aws" {')
+
+        # Switching back to a single file removes the split files again
+        assert writer.generate_main_tf(resources, providers)
+        assert [p.name for p in tmp_path.iterdir()] == ["main.tf"]
+
+    def test_write_main_tf_replaces_split_files(self, writer, tmp_path):
+        """Test writing pre-rendered content removes the split files like generate_main_tf"""
+        resources = [{"type": "aws_instance", "name": "web", "config": {"ami": "ami-123"}}]
+        assert writer.generate_split_tf(resources)
+
+        content = writer.render_main_tf(resources)
+        assert writer.write_main_tf(content)
+        assert [p.name for p in tmp_path.iterdir()] == ["main.tf"]
+        assert (tmp_path / "main.tf").read_text() == content
+
+    def test_split_drops_unused_provider_files(self, writer, tmp_path):
+        """Test a split removes the files of providers that are no longer used"""
+        resources = [
+            {"type": "aws_instance", "name": "web", "config": {"ami": "ami-123"}},
+            {"type": "azurerm_resource_group", "name": "rg", "config": {"location": "East US"}},
+        ]
+        assert writer.generate_split_tf(resources)
+        assert writer.generate_split_tf(resources[:1])
+        assert sorted(p.name for p in tmp_path.iterdir()) == [".terrascope-split", "aws.tf", "providers.tf"]
+
+    def test_generate_main_tf_keeps_unmanaged_files(self, writer, tmp_path):
+        """Test files the writer did not create survive a save"""
+        (tmp_path / "providers.tf").write_text('provider "aws" {}\n')
+        (tmp_path / "aws.tf").write_text("# hand-written\n")
+        resources = [{"type": "aws_instance", "name": "web", "config": {"ami": "ami-123"}}]
+        assert writer.generate_main_tf(resources)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["aws.tf", "main.tf", "providers.tf"]
+
+
+if __name__ == "__main__":
+    # Run with pytest
+    pytest.main([__file__, "-v"])